@@ -0,0 +1,291 @@
+"""
+Tests for fetcher-side parsing helpers (no network).
+Run with: python3 -m pytest tests/ -v
+"""
+import sys
+import os
+from collections import OrderedDict
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from weather_collector.fetchers.pws import _parse_pws_temperature
+
+
+# ── PWS scrape ───────────────────────────────────────────────────────────────
+
+class TestPwsParse:
+
+    def test_finds_temperature_span(self):
+        html = (b'<div><span class="wu-value wu-value-to" _ngcontent-c12="">'
+                b' 71.4 </span><span class="wu-label">F</span></div>')
+        assert _parse_pws_temperature(html) == 71.4
+
+    def test_negative_temperature(self):
+        html = b'<span class="wu-value wu-value-to">-3</span>'
+        assert _parse_pws_temperature(html) == -3.0
+
+    def test_ignores_other_wu_values(self):
+        html = (b'<span class="wu-value wu-value-rh">88</span>'
+                b'<span class="wu-value wu-value-to">55.0</span>')
+        assert _parse_pws_temperature(html) == 55.0
+
+    def test_missing_span(self):
+        assert _parse_pws_temperature(b'<span class="wu-value">--</span>') is None
+
+
+# ── Open-Meteo combined call ─────────────────────────────────────────────────
+
+class TestCurrentAndHourlySplit:
+
+    def test_split_into_two_responses(self, monkeypatch):
+        from weather_collector.fetchers import open_meteo
+        combined = {
+            "latitude": 42.5, "elevation": 12.0,
+            "current_units": {"temperature_2m": "°F"},
+            "current": {"temperature_2m": 61.0},
+            "hourly_units": {"temperature_2m": "°F"},
+            "hourly": {"time": ["2026-08-08T10:00"], "temperature_2m": [61.0]},
+        }
+        monkeypatch.setattr(open_meteo, "_om_get",
+                            lambda params, label: (combined, {"status": "ok", "model": label}))
+        (cur, cur_meta), (hr, hr_meta) = open_meteo.fetch_current_and_hourly()
+        assert cur["current"] == {"temperature_2m": 61.0}
+        assert "hourly" not in cur and "hourly_units" not in cur
+        assert hr["hourly"]["temperature_2m"] == [61.0]
+        assert "current" not in hr and "current_units" not in hr
+        assert cur["elevation"] == hr["elevation"] == 12.0
+        assert cur_meta["model"] == "GFS current"
+        assert hr_meta["model"] == "HRRR hourly"
+
+    def test_rate_limit_skips_fallbacks(self, monkeypatch):
+        from weather_collector.fetchers import open_meteo
+        calls = []
+
+        def fake_get(*a, **k):
+            calls.append(k.get("params"))
+            return _FakeResponse(429)
+
+        monkeypatch.setattr(open_meteo.SESSION, "get", fake_get)
+        (cur, cur_meta), (hr, hr_meta) = open_meteo.fetch_current_and_hourly()
+        assert cur is None and hr is None
+        assert cur_meta["http_status"] == hr_meta["http_status"] == 429
+        assert len(calls) == 1
+
+    def test_other_errors_still_fall_back(self, monkeypatch):
+        from weather_collector.fetchers import open_meteo
+        calls = []
+
+        def fake_get(*a, **k):
+            calls.append(k.get("params"))
+            return _FakeResponse(503)
+
+        monkeypatch.setattr(open_meteo.SESSION, "get", fake_get)
+        open_meteo.fetch_current_and_hourly()
+        # combined, then current + HRRR hourly + its GFS fallback
+        assert len(calls) == 4
+
+
+# ── HTTP revalidation cache ──────────────────────────────────────────────────
+
+class _FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class TestGetJsonRevalidated:
+
+    def test_304_returns_cached_body(self, monkeypatch):
+        from weather_collector.fetchers import http
+        monkeypatch.setattr(http, "_REVALIDATE_CACHE", OrderedDict())
+        sent = []
+
+        def fake_get(url, params=None, headers=None, timeout=None):
+            sent.append(headers)
+            if len(sent) == 1:
+                return _FakeResponse(200, b'{"features": []}', {"ETag": '"abc"'})
+            return _FakeResponse(304)
+
+        monkeypatch.setattr(http.SESSION, "get", fake_get)
+        first = http.get_json_revalidated("https://example.test/alerts")
+        second = http.get_json_revalidated("https://example.test/alerts")
+        assert first == second == {"features": []}
+        assert "If-None-Match" not in sent[0]
+        assert sent[1]["If-None-Match"] == '"abc"'
+
+    def test_no_validators_not_cached(self, monkeypatch):
+        from weather_collector.fetchers import http
+        monkeypatch.setattr(http, "_REVALIDATE_CACHE", OrderedDict())
+        monkeypatch.setattr(http.SESSION, "get",
+                            lambda *a, **k: _FakeResponse(200, b'{"a": 1}'))
+        assert http.get_json_revalidated("https://example.test/x") == {"a": 1}
+        assert http._REVALIDATE_CACHE == {}
+
+    def test_max_age_skips_request_while_fresh(self, monkeypatch):
+        from weather_collector.fetchers import http
+        monkeypatch.setattr(http, "_REVALIDATE_CACHE", OrderedDict())
+        calls = []
+
+        def fake_get(*a, **k):
+            calls.append(k.get("params"))
+            return _FakeResponse(200, b'{"predictions": []}')
+
+        monkeypatch.setattr(http.SESSION, "get", fake_get)
+        for _ in range(2):
+            assert http.get_json_revalidated("https://example.test/tides",
+                                             params={"d": "1"}, max_age=60) == {"predictions": []}
+        assert len(calls) == 1
+        http.get_json_revalidated("https://example.test/tides", params={"d": "1"}, max_age=0)
+        assert len(calls) == 2
+
+    def test_cache_is_bounded(self, monkeypatch):
+        from weather_collector.fetchers import http
+        monkeypatch.setattr(http, "_REVALIDATE_CACHE", OrderedDict())
+        monkeypatch.setattr(http, "_REVALIDATE_MAX_ENTRIES", 3)
+        monkeypatch.setattr(http.SESSION, "get",
+                            lambda *a, **k: _FakeResponse(200, b'{}', {"ETag": '"x"'}))
+        for day in range(5):
+            http.get_json_revalidated("https://example.test/tides", params={"d": day})
+        assert [k[1] for k in http._REVALIDATE_CACHE] == [(("d", 2),), (("d", 3),), (("d", 4),)]
+
+    def test_revalidated_entry_outlives_dead_keys(self, monkeypatch):
+        from weather_collector.fetchers import http
+        monkeypatch.setattr(http, "_REVALIDATE_CACHE", OrderedDict())
+        monkeypatch.setattr(http, "_REVALIDATE_MAX_ENTRIES", 3)
+
+        def fake_get(url, params=None, headers=None, timeout=None):
+            if headers.get("If-None-Match"):
+                return _FakeResponse(304)
+            return _FakeResponse(200, b'{}', {"ETag": '"x"'})
+
+        monkeypatch.setattr(http.SESSION, "get", fake_get)
+        http.get_json_revalidated("https://example.test/alerts")
+        for hour in range(4):
+            http.get_json_revalidated("https://example.test/tides", params={"h": hour})
+            http.get_json_revalidated("https://example.test/alerts")  # 304
+        assert ("https://example.test/alerts", ()) in http._REVALIDATE_CACHE
+
+
+# ── PWS cache ────────────────────────────────────────────────────────────────
+
+class TestPwsCache:
+
+    def _run(self, monkeypatch, tmp_path, cached, response):
+        from weather_collector.fetchers import pws
+        from weather_collector.utils import save_json
+        cache = tmp_path / "last_pws.json"
+        if cached is not None:
+            save_json(cache, cached)
+        monkeypatch.setattr(pws, "PWS_CACHE_FILE", cache)
+        calls = []
+
+        def fake_get(*a, **k):
+            calls.append(k.get("headers"))
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr(pws.SESSION, "get", fake_get)
+        data, meta = pws.fetch_pws_current()
+        return data, meta, calls
+
+    def _reading(self, minutes_ago):
+        from datetime import datetime, timedelta, timezone
+        t = datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+        return {"station": "X", "name": "Castle Hill", "temperature": 61.0, "stale": False,
+                "updated": t.isoformat().replace("+00:00", "Z"), "etag": '"e1"'}
+
+    def test_fresh_cache_skips_request(self, monkeypatch, tmp_path):
+        data, meta, calls = self._run(monkeypatch, tmp_path, self._reading(3), None)
+        assert calls == []
+        assert data["temperature"] == 61.0 and data["stale"] is False
+        assert "etag" not in data
+        assert meta["status"] == "ok" and meta["cached"] is True
+
+    def test_older_cache_revalidates(self, monkeypatch, tmp_path):
+        data, meta, calls = self._run(monkeypatch, tmp_path, self._reading(20),
+                                      _FakeResponse(304))
+        assert calls[0]["If-None-Match"] == '"e1"'
+        assert meta["not_modified"] is True and data["stale"] is False
+
+    def test_failed_scrape_serves_recent_cache_stale(self, monkeypatch, tmp_path):
+        data, meta, _ = self._run(monkeypatch, tmp_path, self._reading(60),
+                                  RuntimeError("boom"))
+        assert data["temperature"] == 61.0 and data["stale"] is True
+        assert meta["status"] == "error"
+
+    def test_failed_scrape_drops_ancient_cache(self, monkeypatch, tmp_path):
+        data, _, _ = self._run(monkeypatch, tmp_path, self._reading(600),
+                               RuntimeError("boom"))
+        assert data["temperature"] is None and data["stale"] is True
+
+
+# ── Shared session ───────────────────────────────────────────────────────────
+
+class TestConnectTimeoutAdapter:
+
+    def _sent_timeout(self, monkeypatch, timeout):
+        from requests.adapters import HTTPAdapter
+        from weather_collector.fetchers import http
+        seen = {}
+
+        def fake_send(self, request, timeout=None, **kwargs):
+            seen["timeout"] = timeout
+
+        monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+        http._ConnectTimeoutAdapter().send(None, timeout=timeout)
+        return seen["timeout"]
+
+    def test_scalar_split_into_connect_and_read(self, monkeypatch):
+        assert self._sent_timeout(monkeypatch, 30) == (5, 30)
+        assert self._sent_timeout(monkeypatch, 2) == (2, 2)
+
+    def test_explicit_tuple_untouched(self, monkeypatch):
+        assert self._sent_timeout(monkeypatch, (1, 9)) == (1, 9)
+
+
+# ── NDBC buoy units ──────────────────────────────────────────────────────────
+
+class TestBuoyFinalUnits:
+
+    def test_zero_readings_are_kept(self):
+        from weather_collector.fetchers.noaa import _buoy_final_units
+        out = _buoy_final_units({
+            "wind_speed_ms": 0.0, "gust_ms": 0.0, "wave_ht_m": 0.0,
+            "air_temp_c": 0.0, "water_temp_c": 0.0, "dewpoint_c": 0.0,
+        })
+        assert out["wind_mph"] == out["gust_mph"] == out["wave_ht_ft"] == 0.0
+        assert out["air_temp_f"] == out["water_temp_f"] == out["dewpoint_f"] == 32.0
+
+    def test_missing_readings_are_none(self):
+        from weather_collector.fetchers.noaa import _buoy_final_units
+        out = _buoy_final_units({"wind_speed_ms": 5.0, "water_temp_c": 10.0})
+        assert out["wind_mph"] == round(5.0 * 2.23694, 1)
+        assert out["water_temp_f"] == 50.0
+        assert out["gust_mph"] is None and out["air_temp_f"] is None
+
+
+# ── Tides ────────────────────────────────────────────────────────────────────
+
+class TestTidesCurve:
+
+    def test_malformed_predictions_skipped(self, monkeypatch):
+        from weather_collector.fetchers import tides
+        preds = [
+            {"t": "2026-08-08 00:00", "v": "1.5"},
+            {"v": "1.6"},                        # no timestamp
+            {"t": "2026-08-08 00:12", "v": ""},  # blank height
+            {"t": "2026-08-08 00:18"},           # no height
+            {"t": "2026-08-08 00:24", "v": "1.8"},
+        ]
+        monkeypatch.setattr(tides, "get_json_revalidated",
+                            lambda *a, **k: {"predictions": preds})
+        data, meta = tides.fetch_tides()
+        assert meta["status"] == "ok"
+        assert data["curve"] == {"times": ["2026-08-08 00:00", "2026-08-08 00:24"],
+                                 "heights": [1.5, 1.8]}
+
@@ -9,6 +9,15 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from weather_collector.processors.fog import calculate_fog_risk
 from weather_collector.processors.wet_bulb import calculate_wet_bulb
 from weather_collector.processors.sea_breeze import detect_sea_breeze
+from weather_collector.processors.normalize import normalize_current
+from weather_collector.processors.state_stamp import synoptic_regime
+from weather_collector.processors.forecast_text import _local_date_hour
+from weather_collector.processors.hourly_trim import LOCAL_TZ, trim_hourly_to_current_hour
+from weather_collector.processors.wind_risk import (
+    _scan_exposure_factor, find_peak, get_exposure_factor, worry_level, worry_score,
+)
+from weather_collector.processors.precip_850mb import classify_850mb_precip_type
+from weather_collector.processors.precip_surface import classify_surface_precip_type
 
 
 # ── Fog ──────────────────────────────────────────────────────────────────────
@@ -149,3 +158,191 @@ class TestSeaBreeze:
         detect_sea_breeze(data)
         assert data["sea_breeze"]["active"] is False
         assert "Insufficient" in data["sea_breeze"]["reason"]
+
+
+# ── Wind risk ────────────────────────────────────────────────────────────────
+
+class TestWindExposure:
+
+    def test_lut_matches_table_scan(self):
+        for d in range(360):
+            assert get_exposure_factor(d) == _scan_exposure_factor(d)
+
+    def test_bearing_wraps_and_truncates(self):
+        assert get_exposure_factor(370.9) == get_exposure_factor(10)
+        assert get_exposure_factor(-90) == get_exposure_factor(270)
+
+    def test_worry_score_power(self):
+        assert worry_score(20, 0.25) == round(20 * 0.25 ** 1.5, 2)
+        assert worry_score(20, 0.33) == round(20 * 0.33 ** 1.5, 2)
+
+
+class TestFindPeak:
+
+    def test_first_max_wins_and_skips_gaps(self):
+        vals = [10.0, None, 25.0, 25.0, None, 30.0]
+        dirs = [90.0, 180.0, 200.0, 210.0, 220.0, None]
+        times = ["t0", "t1", "t2", "t3", "t4", "t5"]
+        assert find_peak(vals, dirs, times, 6) == (25.0, 200.0, "t2")
+
+    def test_short_times_and_no_data(self):
+        assert find_peak([5.0, 8.0], [10.0, 20.0], ["t0"], 2) == (8.0, 20.0, None)
+        assert find_peak([None], [90.0], ["t0"], 1) == (None, None, None)
+
+    def test_compute_wind_risk_converts_each_value_once(self, monkeypatch):
+        from weather_collector.processors import wind_risk
+        calls = []
+        real = wind_risk.safe_num
+
+        def counting(x):
+            calls.append(x)
+            return real(x)
+
+        monkeypatch.setattr(wind_risk, "safe_num", counting)
+        data = {"hourly": {
+            "wind_gusts": [20, "bad", 30], "wind_speed": [10, 12, 15],
+            "wind_direction": ["200", 210, 220], "times": ["t0", "t1", "t2"],
+        }}
+        risk = wind_risk.compute_wind_risk(data, peak_window_hours=3)
+        assert len(calls) == 9  # three columns x three slots, nothing twice
+        assert risk["gust"]["peak_mph"] == 30.0
+        assert risk["gust"]["direction_deg"] == 220
+        assert risk["sustained"]["peak_time"] == "t2"
+
+
+# ── Threshold classifiers ────────────────────────────────────────────────────
+
+class TestThresholdClassifiers:
+
+    def test_worry_level_boundaries_inclusive(self):
+        assert worry_level(0) == "Calm"
+        assert worry_level(4.9) == "Calm"
+        assert worry_level(5) == "Light winds"
+        assert worry_level(12) == "Breezy"
+        assert worry_level(20) == "Windy"
+        assert worry_level(30) == "Very windy"
+        assert worry_level(99) == "Very windy"
+
+    def test_nan_falls_in_lowest_band(self):
+        # The old ladders' >= checks were all false for NaN
+        assert worry_level(float("nan")) == "Calm"
+        assert classify_850mb_precip_type(float("nan")) == "Heavy snow"
+
+    def test_850mb_bands(self):
+        assert classify_850mb_precip_type(None) is None
+        assert classify_850mb_precip_type(24.9) == "Heavy snow"
+        assert classify_850mb_precip_type(25) == "Snow"
+        assert classify_850mb_precip_type(32) == "Mixed"
+        assert classify_850mb_precip_type(39) == "Rain"
+
+    def test_surface_bands(self):
+        assert classify_surface_precip_type(None) is None
+        assert classify_surface_precip_type(31.9) == "snow"
+        assert classify_surface_precip_type(32.0) == "mixed"
+        assert classify_surface_precip_type(35.0) == "rain"
+
+
+# ── Normalize ────────────────────────────────────────────────────────────────
+
+class TestNormalizeCurrent:
+
+    def test_maps_raw_keys_and_derives_labels(self):
+        out = normalize_current({"current": {
+            "temperature_2m": 61.2, "pressure_msl": 1012.0, "weather_code": 3,
+        }})
+        assert out["temperature"] == 61.2
+        assert out["pressure"] == 1012.0
+        assert out["weather_description"] == "Overcast"
+        assert out["visibility"] is None
+        assert list(out)[:8] == [
+            "temperature", "apparent_temperature", "humidity", "dew_point",
+            "precipitation", "weather_code", "weather_description", "weather_emoji",
+        ]
+
+    def test_missing_response(self):
+        assert normalize_current(None) is None
+
+
+# ── State ────────────────────────────────────────────────────────────────────
+
+class TestSynopticRegime:
+
+    def test_reads_stamped_regime(self):
+        wd = {"derived": {"state": {"regime_synoptic": "ne_flow"}}}
+        assert synoptic_regime(wd) == "ne_flow"
+
+    def test_missing_levels(self):
+        assert synoptic_regime({}) is None
+        assert synoptic_regime({"derived": None}) is None
+        assert synoptic_regime({"derived": {"state": {}}}) is None
+
+
+# ── Forecast text ────────────────────────────────────────────────────────────
+
+class TestLocalDateHour:
+
+    def test_wall_clock_fields(self):
+        from datetime import date
+        assert _local_date_hour("2026-11-01T01:00") == (date(2026, 11, 1), 1)
+        assert _local_date_hour("2026-08-08T23:00") == (date(2026, 8, 8), 23)
+
+
+# ── Hourly trim ──────────────────────────────────────────────────────────────
+
+def _hour_strings(start, n):
+    from datetime import timedelta
+    return [(start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M") for i in range(n)]
+
+
+class TestTrimHourly:
+
+    def _top_of_hour(self, offset_hours):
+        from datetime import datetime, timedelta
+        now = datetime.now(LOCAL_TZ).replace(minute=0, second=0, microsecond=0)
+        return now + timedelta(hours=offset_hours)
+
+    def test_trims_past_hours(self):
+        times = _hour_strings(self._top_of_hour(-3), 8)
+        wd = {"hourly": {"times": times, "temperature": list(range(8))}}
+        trim_hourly_to_current_hour(wd)
+        assert wd["hourly"]["times"] == times[3:]
+        assert wd["hourly"]["temperature"] == [3, 4, 5, 6, 7]
+
+    def test_all_past_left_untrimmed(self):
+        times = _hour_strings(self._top_of_hour(-10), 4)
+        wd = {"hourly": {"times": times}}
+        trim_hourly_to_current_hour(wd)
+        assert wd["hourly"]["times"] == times
+
+
+# ── Frost log ────────────────────────────────────────────────────────────────
+
+class TestFrostLoggedDates:
+
+    def _run(self, monkeypatch, tmp_path, logged_dates):
+        from datetime import date, datetime, timezone
+        from weather_collector.processors import frost
+        from weather_collector.utils import load_json, save_json
+        today = datetime.now(timezone.utc).date()
+        year = today.year if (today.month, today.day) >= (10, 1) else today.year - 1
+        path = tmp_path / "frost_log.json"
+        save_json(path, {
+            "season_start": date(year, 10, 1).isoformat(),
+            "freeze_days": 0, "hard_freeze_days": 0, "severe_days": 0,
+            "last_freeze": None, "last_hard": None, "last_severe": None,
+            "logged_dates": logged_dates,
+        })
+        monkeypatch.setattr(frost, "FROST_LOG_FILE", str(path))
+        frost.update_frost_log(None)
+        return load_json(path)["logged_dates"]
+
+    def test_legacy_order_normalized_once(self, monkeypatch, tmp_path):
+        legacy = ["2025-10-05", "2025-10-03", "2025-10-04", "2025-10-03",
+                  "2025-10-01", "2025-10-02"]
+        assert self._run(monkeypatch, tmp_path, legacy) == [
+            "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-04", "2025-10-05"]
+
+    def test_sorted_list_kept_as_is(self, monkeypatch, tmp_path):
+        dates = ["2025-10-01", "2025-10-02", "2025-10-03", "2025-10-04", "2025-10-05"]
+        assert self._run(monkeypatch, tmp_path, dates) == dates
+
@@ -0,0 +1,152 @@
+"""
+Tests for weather_collector.utils.
+Run with: python3 -m pytest tests/ -v
+"""
+import math
+import sys
+from datetime import datetime, timezone
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from weather_collector.utils import (
+    dumps_json, loads_json, load_json, save_json, safe_float, compute_age_minutes, hour_index,
+    get_weather_description, get_weather_emoji, get_weather_info,
+)
+
+
+# ── JSON helpers ─────────────────────────────────────────────────────────────
+
+class TestJsonHelpers:
+
+    def test_round_trip(self):
+        obj = {"times": ["2026-08-08T10:00"], "temperature": [71.2, None]}
+        assert loads_json(dumps_json(obj)) == obj
+
+    def test_compact_by_default(self):
+        assert dumps_json({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+    def test_indent(self):
+        assert dumps_json({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+
+    def test_non_str_keys_stringified(self):
+        # Matches stdlib json, which the GCS logs were written with
+        assert loads_json(dumps_json({7: "x"})) == {"7": "x"}
+
+    def test_non_finite_written_as_null(self):
+        obj = {"v": [float("nan"), float("inf"), -float("inf"), 1.5]}
+        assert dumps_json(obj) == b'{"v":[null,null,null,1.5]}'
+
+    def test_non_finite_written_as_null_without_orjson(self, monkeypatch):
+        from weather_collector import utils
+        monkeypatch.setattr(utils, "orjson", None)
+        obj = {"v": [float("nan"), float("inf"), -float("inf"), 1.5], 7: (float("nan"),)}
+        assert dumps_json(obj) == b'{"v":[null,null,null,1.5],"7":[null]}'
+
+    def test_loads_legacy_nan(self):
+        # Blobs written by the stdlib encoder may contain bare NaN
+        out = loads_json(b'{"v": NaN}')
+        assert math.isnan(out["v"])
+
+    def test_loads_accepts_str(self):
+        assert loads_json('{"a": 1}') == {"a": 1}
+
+    def test_save_json_compact_by_default(self, tmp_path):
+        p = tmp_path / "cache.json"
+        save_json(p, {"temperature": 61.0})
+        assert p.read_bytes() == b'{"temperature":61.0}'
+        assert load_json(p) == {"temperature": 61.0}
+
+    def test_save_json_skips_identical_write(self, tmp_path):
+        p = tmp_path / "cache.json"
+        assert save_json(p, {"a": 1}) is True
+        mtime = p.stat().st_mtime_ns
+        assert save_json(p, {"a": 1}) is False
+        assert p.stat().st_mtime_ns == mtime
+        assert save_json(p, {"a": 2}) is True
+        assert load_json(p) == {"a": 2}
+
+    def test_save_json_replaces_atomically(self, tmp_path):
+        p = tmp_path / "cache.json"
+        save_json(p, {"a": 1})
+        save_json(p, {"a": 2})
+        assert load_json(p) == {"a": 2}
+        assert [f.name for f in tmp_path.iterdir()] == ["cache.json"]
+
+    def test_save_json_indent(self, tmp_path):
+        p = tmp_path / "frost_log.json"
+        save_json(p, {"freeze_days": 2}, indent=True)
+        assert p.read_bytes() == b'{\n  "freeze_days": 2\n}'
+
+
+# ── safe_float ───────────────────────────────────────────────────────────────
+
+class TestSafeFloat:
+
+    def test_numbers_pass_through(self):
+        assert safe_float(3) == 3.0
+        assert safe_float(2.5) == 2.5
+
+    def test_numeric_strings(self):
+        assert safe_float("71.4") == 71.4
+        assert safe_float(" -3 ") == -3.0
+
+    def test_unparseable(self):
+        assert safe_float(None) is None
+        assert safe_float("MM") is None
+        assert safe_float("") is None
+        assert safe_float([1]) is None
+
+    def test_overflow(self):
+        assert safe_float(10 ** 400) is None
+        assert safe_float(-(10 ** 400)) is None
+
+
+# ── compute_age_minutes ──────────────────────────────────────────────────────
+
+class TestComputeAgeMinutes:
+    NOW = datetime(2026, 8, 8, 12, 0, tzinfo=timezone.utc)
+
+    def test_z_suffix(self):
+        assert compute_age_minutes("2026-08-08T11:30:00Z", self.NOW) == 30.0
+
+    def test_offset_and_naive(self):
+        assert compute_age_minutes("2026-08-08T07:45:00-04:00", self.NOW) == 15.0
+        assert compute_age_minutes("2026-08-08T11:59:30", self.NOW) == 0.5
+
+    def test_unparseable(self):
+        assert compute_age_minutes(None, self.NOW) is None
+        assert compute_age_minutes("yesterday", self.NOW) is None
+
+
+# ── hour_index ───────────────────────────────────────────────────────────────
+
+class TestHourIndex:
+    TIMES = ["2026-08-08T10:00", "2026-08-08T11:00", "2026-08-08T12:00"]
+
+    def test_exact_match(self):
+        assert hour_index(self.TIMES, "2026-08-08T10:00") == 0
+        assert hour_index(self.TIMES, "2026-08-08T12:00") == 2
+
+    def test_absent(self):
+        assert hour_index(self.TIMES, "2026-08-08T11:30") is None
+        assert hour_index(self.TIMES, "2026-08-09T00:00") is None
+        assert hour_index([], "2026-08-08T10:00") is None
+
+
+# ── Weather codes ────────────────────────────────────────────────────────────
+
+class TestWeatherCodes:
+
+    def test_known_codes(self):
+        assert get_weather_description(0) == "Clear"
+        assert get_weather_description(100) == "Mostly Cloudy"
+        assert get_weather_emoji(95) == "⛈️"
+
+    def test_unknown_code_fallbacks(self):
+        assert get_weather_description(42) == "Code 42"
+        assert get_weather_emoji(42) == "🌡️"
+
+    def test_fused_info_matches_single_lookups(self):
+        for code in (0, 3, 61, 100, 99, 42):
+            assert get_weather_info(code) == (get_weather_description(code),
+                                              get_weather_emoji(code))
@@ -3,7 +3,6 @@
 Wyman Cove Weather Station - Main Collector
 Orchestrates all data fetching and processing
 """
-import json
 import logging
 import math
 import os
@@ -18,7 +17,7 @@ from .config import (LAT, LON, SCHEMA_VERSION, LOCATION_NAME, WIND_EXPOSURE_TABL
                      WORRY_NOTICEABLE, WORRY_NOTABLE, WORRY_SIGNIFICANT, WORRY_SEVERE)
 from .gcs_io import BUCKET, get_client, upload_json
 from .stale_cache import apply_stale_fallbacks, load_prev_weather_data
-from .utils import iso_utc_now, compute_age_minutes, redact_secrets
+from .utils import iso_utc_now, load_json, redact_secrets
 
 # Import fetchers (data fetching orchestration is fully in fetchers/fetch_all.py;
 # briefing AI is called directly from main() since it needs the assembled
@@ -54,6 +53,8 @@ from .processors.decay_apply import apply_decay_corrections, recompute_derived_m
 from .processors.raw_integrity import snapshot_raw_baseline, verify_raw_integrity
 from .processors.normalize import normalize_current, normalize_hourly, normalize_daily, empty_hourly
 
+TZ = pytz.timezone("America/New_York")
+
 FROST_LOG_GCS_PATH = "frost_log.json"
 WEATHER_DATA_GCS_PATH = "weather_data.json"
 FROST_LOG_TMP = Path("/tmp/frost_log.json")
@@ -98,12 +99,12 @@ def build_weather_data(current_data, hourly_data, daily_data, pws_data, tide_dat
     }
 
     # Current conditions
-    weather_data["current"] = normalize_current(current_data) or {}
+    current = weather_data["current"] = normalize_current(current_data) or {}
 
     # ASOS condition override - prefer observed conditions over model
     if kbvy_data and kbvy_data.get("present_weather"):
-        weather_data["current"]["condition_override"] = kbvy_data["present_weather"]
-        weather_data["current"]["condition_source"] = "KBVY observed"
+        current["condition_override"] = kbvy_data["present_weather"]
+        current["condition_source"] = "KBVY observed"
     
     
     # Wind: override model with best available observation
@@ -117,22 +118,23 @@ def build_weather_data(current_data, hourly_data, daily_data, pws_data, tide_dat
 
 
     # Pirate Weather cloud cover fallback when HRRR is down
-    if pirate_data and pirate_data.get("hourly_cloud_cover"):
-        if "hourly" not in weather_data:
+    pw_cloud = (pirate_data or {}).get("hourly_cloud_cover")
+    if pw_cloud:
+        hourly = weather_data.get("hourly")
+        if hourly is None:
             # HRRR completely unavailable — seed a minimal hourly block from PW
-            _eastern = pytz.timezone("America/New_York")
             _pw_times = [
-                _eastern.localize(datetime.fromtimestamp(ts)).strftime("%Y-%m-%dT%H:%M")
+                TZ.localize(datetime.fromtimestamp(ts)).strftime("%Y-%m-%dT%H:%M")
                 for ts in pirate_data.get("hourly_times", [])
                 if ts is not None
             ]
-            weather_data["hourly"] = empty_hourly()
-            weather_data["hourly"]["times"] = _pw_times
-            weather_data["hourly"]["cloud_cover"] = pirate_data["hourly_cloud_cover"][:len(_pw_times)]
+            hourly = weather_data["hourly"] = empty_hourly()
+            hourly["times"] = _pw_times
+            hourly["cloud_cover"] = pw_cloud[:len(_pw_times)]
             logging.warning("  ⚠️ HRRR unavailable — using Pirate Weather cloud cover for hourly block")
-        elif not weather_data["hourly"].get("cloud_cover"):
+        elif not hourly.get("cloud_cover"):
             # HRRR returned data but cloud cover is empty — patch from PW
-            weather_data["hourly"]["cloud_cover"] = pirate_data["hourly_cloud_cover"][:len(weather_data["hourly"]["times"])]
+            hourly["cloud_cover"] = pw_cloud[:len(hourly["times"])]
             logging.warning("  ⚠️ HRRR cloud cover empty — patched from Pirate Weather")
 
     # Snapshot every hourly array with a raw_ counterpart, BEFORE any layer
@@ -236,7 +238,6 @@ def build_weather_data(current_data, hourly_data, daily_data, pws_data, tide_dat
 
     # Bias-corrected hourly arrays (must run after build_hyperlocal_data)
     add_corrected_hourly_arrays(weather_data)
-    _hyp = weather_data.get("hyperlocal", {})
 
     # Daily extremes: log current obs to rolling 24h log + 48h forecast snapshot,
     # then derive today (obs + remaining forecast), yesterday (obs only),
@@ -259,8 +260,9 @@ def build_weather_data(current_data, hourly_data, daily_data, pws_data, tide_dat
     wind_risk = compute_wind_risk(weather_data)
     if wind_risk:
         weather_data["wind_risk"] = wind_risk
-        if wind_risk.get("gust", {}).get("peak_time"):
-            derived["wind_peak_time"] = wind_risk["gust"]["peak_time"]
+        gust_peak_time = (wind_risk.get("gust") or {}).get("peak_time")
+        if gust_peak_time:
+            derived["wind_peak_time"] = gust_peak_time
 
     # Trough signal
     trough_data = compute_trough_signal(hourly_data)
@@ -445,6 +447,7 @@ def main():
 
     # Download frost log from GCS before fetching (needed for update_frost_log)
     _download_frost_log_from_gcs()
+    frost_log_before = load_json(FROST_LOG_TMP)
 
     # Fetch all data — Open-Meteo sequential, everything else parallel.
     fetched = fetch_all_sources()
@@ -455,11 +458,18 @@ def main():
     frost_log = update_frost_log(fetched.daily_data)
     logging.info(f"  ⏱  Frost log: {time.time() - t0:.1f}s")
 
-    # Upload updated frost log back to GCS
+    # Upload updated frost log back to GCS (skipped when this run changed nothing)
     if FROST_LOG_TMP.exists():
         try:
-            frost_log_data = json.loads(FROST_LOG_TMP.read_text())
-            upload_json(frost_log_data, FROST_LOG_GCS_PATH, "frost_log.json")
+            frost_log_data = load_json(FROST_LOG_TMP)
+            if frost_log_data is None:
+                # Unreadable scratch file — never overwrite the season's log with null
+                logging.warning("  ⚠  frost_log.json unreadable — skipping upload")
+            elif frost_log_data == frost_log_before:
+                logging.info("  ℹ  frost_log.json unchanged — skipping upload")
+            else:
+                # The GCS copy is the one people audit — keep it readable
+                upload_json(frost_log_data, FROST_LOG_GCS_PATH, "frost_log.json", indent=True)
         except Exception as e:
             logging.warning(f"  ⚠  Could not upload frost_log.json: {redact_secrets(e)}")
 
@@ -765,7 +775,7 @@ def main():
     # whitelist settled) and per-tick GCS cost was visible in the bill.
     # Also prunes forecast_error_log.jsonl to RETENTION_DAYS and resets the GCS
     # compose component count back to 1.
-    now_local = datetime.now(pytz.timezone("America/New_York"))
+    now_local = datetime.now(TZ)
     if now_local.hour in (3, 15) and now_local.minute < 10:
         t0 = time.time()
         try:
@@ -3,7 +3,7 @@ Briefing headline generator using Google Gemini API (free tier).
 Generates an editorial headline and subheadline from weather data.
 Falls back gracefully if the API is unavailable.
 """
-from ..utils import redact_secrets
+from ..utils import dumps_json, loads_json, redact_secrets
 
 import json
 import logging
@@ -15,6 +15,8 @@ from datetime import datetime
 import pytz
 import requests
 
+TZ = pytz.timezone("America/New_York")
+
 GEMINI_API_KEY = os.environ["GEMINI_API_KEY"]
 GEMINI_MODEL = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash-lite")
 GEMINI_URL = f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_MODEL}:generateContent"
@@ -204,12 +206,9 @@ def _build_weather_summary(weather_data):
         intensity_str = f" · peak {intensity_label} ({peak_intensity:.2f}\"/hr)" if peak_intensity >= 0.01 else ""
         precip_line = f"Precip: max {max_pop}% POP, {rain_inches}\" total{intensity_str}"
         if rain_start:
-            from datetime import datetime
-            import pytz
             try:
-                eastern = pytz.timezone("America/New_York")
-                now_et = datetime.now(eastern)
-                rain_dt = datetime.fromisoformat(rain_start).replace(tzinfo=eastern) if rain_start[-1] != "Z" else datetime.fromisoformat(rain_start.replace("Z", "+00:00")).astimezone(eastern)
+                now_et = datetime.now(TZ)
+                rain_dt = datetime.fromisoformat(rain_start).replace(tzinfo=TZ) if rain_start[-1] != "Z" else datetime.fromisoformat(rain_start.replace("Z", "+00:00")).astimezone(TZ)
                 delta_hours = (rain_dt - now_et).total_seconds() / 3600
                 hour = rain_dt.hour
                 if hour < 6:
@@ -376,7 +375,7 @@ def _load_cached_briefing():
         bucket = client.bucket("myweather-data")
         blob = bucket.blob(_BRIEFING_CACHE_PATH)
         if blob.exists():
-            data = json.loads(blob.download_as_text())
+            data = loads_json(blob.download_as_bytes())
             logging.info(f"  ✓ Briefing cache loaded: {data.get('headline', '?')[:50]}")
             return data
     except Exception as e:
@@ -401,15 +400,13 @@ def _update_briefing_cache(briefing=None, was_429=False):
     """
     try:
         from google.cloud import storage as gcs
-        from datetime import datetime
-        import pytz
         client = gcs.Client()
         bucket = client.bucket("myweather-data")
         blob = bucket.blob(_BRIEFING_CACHE_PATH)
-        now_iso = datetime.now(pytz.timezone("America/New_York")).isoformat()
+        now_iso = datetime.now(TZ).isoformat()
         if blob.exists():
             try:
-                data = json.loads(blob.download_as_text())
+                data = loads_json(blob.download_as_bytes())
             except Exception:
                 data = {}
         else:
@@ -422,7 +419,7 @@ def _update_briefing_cache(briefing=None, was_429=False):
         data["last_attempt_at"] = now_iso
         if was_429:
             data["last_429_at"] = now_iso
-        blob.upload_from_string(json.dumps(data), content_type="application/json")
+        blob.upload_from_string(dumps_json(data), content_type="application/json")
         if briefing is not None:
             logging.info(f"  ✓ Briefing cache saved ({data.get('model','?')})")
     except Exception as e:
@@ -600,10 +597,7 @@ def _should_call_gemini():
       • cached_at (last success) still drives the data we serve when the
         throttle says skip.
     """
-    from datetime import datetime
-    import pytz
-    eastern = pytz.timezone("America/New_York")
-    now = datetime.now(eastern)
+    now = datetime.now(TZ)
 
     # In-memory fast path — survives GCS failures; reliable with max-instances=1
     if _last_gemini_call_time is not None:
@@ -618,7 +612,7 @@ def _should_call_gemini():
         bucket = client.bucket("myweather-data")
         blob = bucket.blob(_BRIEFING_CACHE_PATH)
         if blob.exists():
-            data = json.loads(blob.download_as_text())
+            data = loads_json(blob.download_as_bytes())
             # v0.6.113: 429 backoff. If we just hit Google's daily quota,
             # don't try again for several hours.
             # v0.6.139: only applies when Gemini is enabled. Previously a stale
@@ -722,7 +716,6 @@ def generate_briefing(weather_data):
     - Falls back to cached headline on failure
     Returns dict with 'headline' and 'subheadline' keys, or None on failure.
     """
-    import time
 
     global _last_gemini_call_time
 
@@ -750,10 +743,7 @@ def generate_briefing(weather_data):
             return None
 
     # Inject current time so Gemini writes forward-looking content
-    from datetime import datetime
-    import pytz
-    eastern = pytz.timezone("America/New_York")
-    now = datetime.now(eastern)
+    now = datetime.now(TZ)
     time_str = now.strftime("%I:%M %p").lstrip("0")
     day_str = now.strftime("%A, %B %d")
 
@@ -806,18 +796,18 @@ def generate_briefing(weather_data):
             headline = result.get("headline", "").strip()
             subheadline = result.get("subheadline", "").strip()
             if headline:
-                cached_at = datetime.now(eastern).isoformat()
+                cached_at = datetime.now(TZ).isoformat()
                 briefing = {"headline": headline, "subheadline": subheadline, "cached_at": cached_at, "model": "gemini"}
                 valid, reason = _validate_headline(briefing, summary, weather_data)
                 if valid:
                     logging.info(f"  ✓ Briefing (Gemini): {headline}")
                     _update_briefing_cache(briefing=briefing)
-                    _last_gemini_call_time = datetime.now(eastern)
+                    _last_gemini_call_time = datetime.now(TZ)
                     return briefing
                 else:
                     logging.warning(f"  ⊘ Briefing (Gemini) REJECTED ({reason}): {headline!r} — falling through")
                     _update_briefing_cache(was_429=False)
-                    _last_gemini_call_time = datetime.now(eastern)
+                    _last_gemini_call_time = datetime.now(TZ)
         except Exception as e:
             # Capture HTTP status + body excerpt to diagnose Cloud Function-side failures
             # (key + payload were verified working locally; failure is environment-specific).
@@ -828,23 +818,21 @@ def generate_briefing(weather_data):
             # restarts. 429 = daily quota — long cooldown. Other failures =
             # normal 30-min throttle.
             _update_briefing_cache(was_429=(status == 429))
-            _last_gemini_call_time = datetime.now(eastern)
+            _last_gemini_call_time = datetime.now(TZ)
 
     # Groq waterfall (OpenAI-compatible). Tries each model in GROQ_MODELS in
     # order; first one that succeeds + passes the validator wins. Voice stays
     # within the Groq lineup (no provider switch on intra-fallback), so the
     # user-perceived narrator only changes if the whole Groq layer fails.
     if GROQ_API_KEY:
-        groq_briefing = _call_groq_waterfall(summary, time_context, prev_context, weather_data, eastern)
+        groq_briefing = _call_groq_waterfall(summary, time_context, prev_context, weather_data, TZ)
         if groq_briefing is not None:
             return groq_briefing
 
     # All live LLM attempts failed (or both rejected by the validator).
     # Set the throttle so we don't hammer Gemini in the next 30 min, then walk
     # the safe-fallback chain: last-good cached Gemini → deterministic template.
-    from datetime import datetime
-    import pytz
-    _last_gemini_call_time = datetime.now(pytz.timezone("America/New_York"))
+    _last_gemini_call_time = datetime.now(TZ)
 
     cached = _load_cached_briefing()
     if cached and cached.get("headline"):
@@ -870,7 +858,7 @@ def generate_briefing(weather_data):
 
     logging.info(f"  ⚙ Briefing: using deterministic template")
     templated = _templated_briefing(weather_data)
-    templated["cached_at"] = datetime.now(pytz.timezone("America/New_York")).isoformat()
+    templated["cached_at"] = datetime.now(TZ).isoformat()
     return templated
 
 
@@ -895,7 +883,7 @@ def apply_briefing_to_weather_data(weather_data):
         if briefing.get("cached_at"):
             try:
                 cached = datetime.fromisoformat(briefing["cached_at"])
-                gemini_age = round((datetime.now(pytz.timezone("America/New_York")) - cached).total_seconds() / 60, 1)
+                gemini_age = round((datetime.now(TZ) - cached).total_seconds() / 60, 1)
             except Exception:
                 pass
         weather_data["sources"]["gemini"] = {"status": "ok", "age_minutes": gemini_age}
@@ -10,16 +10,16 @@ recent one), so no dedupe-by-species is needed within a single call. We merge
 the two lists into a unified species[] array with a `notable` flag.
 """
 import math
-import requests
 
-from ..config import LAT, LON, HEADERS_DEFAULT
+from ..config import LAT, LON
 
 # Birding query center is intentionally shifted slightly N/NE of home
 # to better capture Salem Sound, while displayed distances still use home LAT/LON.
 EBIRD_QUERY_LAT = 42.515
 EBIRD_QUERY_LON = -70.845
 
-from ..utils import iso_utc_now, redact_secrets
+from ..utils import iso_utc_now, loads_json, redact_secrets
+from .http import SESSION
 
 EBIRD_BASE = "https://api.ebird.org/v2/data/obs/geo"
 import os
@@ -45,13 +45,12 @@ def _ebird_get(path, api_key, label):
     """GET from eBird with standard error handling. Returns (list, meta)."""
     meta = {"status": "error", "updated_at": iso_utc_now(), "error": None, "endpoint": label}
     url = f"{EBIRD_BASE}/{path}"
-    headers = dict(HEADERS_DEFAULT)
-    headers["X-eBirdApiToken"] = api_key
+    headers = {"X-eBirdApiToken": api_key}  # merged over the session defaults
     params = {"lat": EBIRD_QUERY_LAT, "lng": EBIRD_QUERY_LON, "dist": RADIUS_KM, "back": BACK_DAYS}
     try:
-        r = requests.get(url, headers=headers, params=params, timeout=20)
+        r = SESSION.get(url, headers=headers, params=params, timeout=20)
         r.raise_for_status()
-        data = r.json()
+        data = loads_json(r.content)
         if not isinstance(data, list):
             raise ValueError(f"unexpected response shape: {type(data).__name__}")
         meta["status"] = "ok"
@@ -112,9 +111,10 @@ def fetch_ebird():
     notable, notable_meta = _ebird_get("recent/notable", EBIRD_API_KEY, "notable")
 
     # Rollup meta: ok if at least recent succeeded. Notable failure is tolerable.
+    fetched_at = iso_utc_now()
     meta = {
         "status": "ok" if recent is not None else "error",
-        "updated_at": iso_utc_now(),
+        "updated_at": fetched_at,
         "error": recent_meta.get("error"),
         "endpoint": "ebird",
         "recent_status": recent_meta["status"],
@@ -142,7 +142,7 @@ def fetch_ebird():
     species.sort(key=lambda s: (0 if s["notable"] else 1, -_dt_sortkey(s["last_seen"])))
 
     data = {
-        "fetched_at": iso_utc_now(),
+        "fetched_at": fetched_at,
         "radius_km": RADIUS_KM,
         "back_days": BACK_DAYS,
         "species_count": len(species),
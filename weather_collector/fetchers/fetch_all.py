@@ -2,8 +2,8 @@
 Orchestrate every data fetch the collector needs.
 
 `fetch_all_sources()` runs the rate-limit-sensitive Open-Meteo calls
-sequentially, then fans out everything else in parallel via
-`fetch_parallel_sources()`, and returns a single `FetchResults` dataclass
+sequentially while everything else fans out in parallel via
+`fetch_parallel_sources()` on a background lane, and returns a single `FetchResults` dataclass
 that bundles all the data + the `sources` meta dict + a `failed_fetches`
 set flagging sequential calls that returned None.
 
@@ -14,15 +14,15 @@ relative to other main()-level steps is what matters.
 """
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
 from .fetch_parallel import fetch_parallel_sources
 from .open_meteo import (
-    fetch_current_gfs,
+    fetch_current_and_hourly,
     fetch_daily_ecmwf,
     fetch_hourly_gfs_7day,
-    fetch_hourly_hrrr,
     fetch_hrrr_daily_temps,
 )
 
@@ -68,7 +68,7 @@ _ERROR_TUPLE = (None, {"status": "error"})
 
 def fetch_all_sources():
     """Run all weather data fetchers — Open-Meteo sequential (rate-limit
-    sensitive), everything else parallel — and return a `FetchResults`
+    sensitive), everything else parallel alongside it — and return a `FetchResults`
     dataclass. The `sources` dict mirrors what gets written to the payload's
     top-level `sources` field; `failed_fetches` is the set used by
     apply_stale_fallbacks to decide which top-level keys need patching from
@@ -76,12 +76,19 @@ def fetch_all_sources():
 
     out = FetchResults()
 
-    # ── Open-Meteo calls: SEQUENTIAL (rate-limit sensitive) ──
-    out.current_data, current_meta = _timed("GFS current", fetch_current_gfs)
-    out.hourly_data, hourly_meta = _timed("HRRR hourly", fetch_hourly_hrrr)
-    out.daily_temps_data, daily_temps_meta = _timed("HRRR daily temps", fetch_hrrr_daily_temps)
-    out.hourly_7day_data, hourly_7day_meta = _timed("GFS 7-day hourly", fetch_hourly_gfs_7day)
-    out.daily_data, daily_meta = _timed("ECMWF daily", fetch_daily_ecmwf)
+    # The non-Open-Meteo sources hit other hosts, so they don't need to wait
+    # for the Open-Meteo lane — wall time is max(lane, fan-out), not the sum.
+    with ThreadPoolExecutor(max_workers=1) as lane:
+        parallel_future = lane.submit(fetch_parallel_sources)
+
+        # ── Open-Meteo calls: SEQUENTIAL (rate-limit sensitive) ──
+        (out.current_data, current_meta), (out.hourly_data, hourly_meta) = _timed(
+            "GFS current + HRRR hourly", fetch_current_and_hourly)
+        out.daily_temps_data, daily_temps_meta = _timed("HRRR daily temps", fetch_hrrr_daily_temps)
+        out.hourly_7day_data, hourly_7day_meta = _timed("GFS 7-day hourly", fetch_hourly_gfs_7day)
+        out.daily_data, daily_meta = _timed("ECMWF daily", fetch_daily_ecmwf)
+
+        parallel_results = parallel_future.result()
 
     # Track which sequential fetches returned None (used by stale fallback)
     if out.current_data is None: out.failed_fetches.add("current")
@@ -89,8 +96,6 @@ def fetch_all_sources():
     if out.daily_data is None:   out.failed_fetches.add("daily")
 
     # ── Everything else: PARALLEL ──
-    parallel_results = fetch_parallel_sources()
-
     out.nws_gridpoints_data, nws_gridpoints_meta = parallel_results.get("NWS gridpoints", _ERROR_TUPLE)
     out.pws_data, pws_meta                       = parallel_results.get("PWS current",    _ERROR_TUPLE)
     out.tide_data, tides_meta                    = parallel_results.get("Tides",          _ERROR_TUPLE)
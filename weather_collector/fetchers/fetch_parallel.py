@@ -1,7 +1,8 @@
 """
 Run all non-rate-limited weather data fetchers in parallel via ThreadPoolExecutor.
-Open-Meteo calls stay sequential in collector.main() because they share a rate
-limit; everything in here is independent and safe to fan out.
+Open-Meteo calls stay sequential in fetch_all (running alongside this fan-out)
+because they share a rate limit; everything in here is independent and safe to
+fan out.
 
 Each fetcher returns either a (data, meta) tuple or a single value (Salem water
 temp is the lone single-value source). On timeout or exception, we substitute
@@ -22,7 +23,7 @@ from .tides import fetch_tides
 from .wu import fetch_wu_stations
 from ..utils import redact_secrets
 
-MAX_WORKERS = 6
+MAX_WORKERS = 12   # one per task — all I/O-bound, so the slowest endpoint sets wall time
 AS_COMPLETED_TIMEOUT = 60
 TASK_TIMEOUT = 45
 
@@ -0,0 +1,130 @@
+"""
+Shared HTTP session for the fetchers.
+
+One pooled requests.Session per process so repeat calls to the same host
+(Open-Meteo in particular) reuse the TCP+TLS connection instead of paying
+a fresh handshake each time. urllib3 keeps a separate pool per host, so
+this single session covers every upstream.
+
+get_json_revalidated() adds HTTP-level caching on top: the last body for
+each URL is kept in-process with its ETag / Last-Modified, and a warm
+instance revalidates instead of re-downloading — or, for slow-changing
+sources given a max_age, skips the request while the body is fresh.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config import HEADERS_DEFAULT
+from ..utils import loads_json
+
+# pool_connections = number of distinct hosts kept warm;
+# pool_maxsize = concurrent connections per host (fetch_parallel runs
+# up to 12 workers, directional clouds fans out a few more).
+_POOL_HOSTS = 10
+_POOL_PER_HOST = 8
+
+# Upper bound on the TCP+TLS connect phase. Callers pass a single read
+# budget (timeout=30); a dead host should fail in seconds, not eat it all.
+CONNECT_TIMEOUT = 5
+
+
+# Transient upstream failures (refused/reset connects, NWS and NOAA 5xx
+# bursts) get two quick retries with 0.5 s-based backoff. Read timeouts are
+# not retried — a hung host would otherwise triple its 30 s read budget —
+# and 429 is left alone so the Open-Meteo rate limit isn't hammered.
+# GET only; the last response is handed back so callers' raise_for_status()
+# still reports the real status.
+_RETRY = Retry(
+    total=2,
+    read=0,
+    backoff_factor=0.5,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+
+class _ConnectTimeoutAdapter(HTTPAdapter):
+    """HTTPAdapter that splits a scalar timeout into (connect, read)."""
+
+    def send(self, request, timeout=None, **kwargs):
+        if isinstance(timeout, (int, float)):
+            timeout = (min(CONNECT_TIMEOUT, timeout), timeout)
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+def _build_session():
+    s = requests.Session()
+    s.headers.update(HEADERS_DEFAULT)
+    adapter = _ConnectTimeoutAdapter(pool_connections=_POOL_HOSTS, pool_maxsize=_POOL_PER_HOST,
+                                     max_retries=_RETRY)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+SESSION = _build_session()
+
+
+# (url, params) -> (etag, last_modified, parsed_body, fetched_monotonic).
+# Lives as long as the warm function instance; a cold start simply begins
+# with full GETs. Capped and least-recently-used first, because
+# date-windowed queries (tides) mint new keys that soon go dead while the
+# alert/METAR keys keep being revalidated. Fetch threads share it, so every
+# write goes through _remember() under the lock.
+_REVALIDATE_CACHE = OrderedDict()
+_REVALIDATE_MAX_ENTRIES = 32
+_REVALIDATE_LOCK = threading.Lock()
+
+
+def _remember(key, entry):
+    """Store/refresh a cache entry as most recently used, evicting the oldest."""
+    with _REVALIDATE_LOCK:
+        _REVALIDATE_CACHE[key] = entry
+        _REVALIDATE_CACHE.move_to_end(key)
+        while len(_REVALIDATE_CACHE) > _REVALIDATE_MAX_ENTRIES:
+            _REVALIDATE_CACHE.popitem(last=False)
+
+
+def get_json_revalidated(url, params=None, headers=None, timeout=30, max_age=None):
+    """
+    GET a JSON endpoint, revalidating against the last response seen for
+    the same URL+params. Returns the parsed body; on 304 Not Modified the
+    cached body is returned without re-downloading or re-parsing.
+    With max_age (seconds), a cached body younger than that is returned
+    without any request at all.
+    Callers must treat the result as read-only (it may be shared).
+    Raises on HTTP errors, like raise_for_status().
+    """
+    key = (url, tuple(sorted((params or {}).items())))
+    cached = _REVALIDATE_CACHE.get(key)
+    now = time.monotonic()
+    if cached and max_age is not None and now - cached[3] < max_age:
+        _remember(key, cached)
+        return cached[2]
+
+    req_headers = dict(headers or {})
+    if cached:
+        etag, last_modified, _, _ = cached
+        if etag:
+            req_headers["If-None-Match"] = etag
+        if last_modified:
+            req_headers["If-Modified-Since"] = last_modified
+
+    r = SESSION.get(url, params=params, headers=req_headers, timeout=timeout)
+    if r.status_code == 304 and cached:
+        _remember(key, (*cached[:3], now))
+        return cached[2]
+    r.raise_for_status()
+
+    data = loads_json(r.content)
+    etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+    if etag or last_modified or max_age is not None:
+        _remember(key, (etag, last_modified, data, now))
+    return data
@@ -1,11 +1,44 @@
 """
 Fetch NOAA observations (KBOS, KBVY, Buoy 44013+44098)
 """
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from ..utils import iso_utc_now, redact_secrets
+from .http import SESSION, get_json_revalidated
 import logging
 
 
+_MS_TO_MPH = 2.23694
+_M_TO_FT = 3.28084
+
+
+def _c_to_f(temp_c):
+    """°C → °F rounded to 0.1; None passes through (0 °C is a real reading)."""
+    return round(temp_c * 9 / 5 + 32, 1) if temp_c is not None else None
+
+
+def _scaled(value, factor, ndigits=1):
+    """value × factor rounded to ndigits; None passes through."""
+    return round(value * factor, ndigits) if value is not None else None
+
+
+def _buoy_final_units(result):
+    """Fused NDBC reading (m/s, m, °C) → published buoy dict (mph, ft, °F).
+    Only a missing value is None: a calm 0 m/s wind, flat 0 m seas or
+    0 °C water/air/dewpoint are real observations."""
+    return {
+        "time": result.get('time'),
+        "wind_dir": result.get('wind_dir'),
+        "wind_mph": _scaled(result.get('wind_speed_ms'), _MS_TO_MPH),
+        "gust_mph": _scaled(result.get('gust_ms'), _MS_TO_MPH),
+        "wave_ht_ft": _scaled(result.get('wave_ht_m'), _M_TO_FT),
+        "wave_period_sec": result.get('wave_period_sec'),
+        "pressure_hpa": result.get('pressure_hpa'),
+        "air_temp_f": _c_to_f(result.get('air_temp_c')),
+        "water_temp_f": _c_to_f(result.get('water_temp_c')),
+        "dewpoint_f": _c_to_f(result.get('dewpoint_c')),
+        "pressure_tend_hpa": result.get('pressure_tend_hpa')
+    }
+
 
 def decode_metar_wx(wx_string):
     """Convert METAR weather codes to human-readable text."""
@@ -117,9 +150,7 @@ def fetch_kbos_obs():
     
     try:
         url = "https://aviationweather.gov/api/data/metar"
-        r = requests.get(url, params={"ids": "KBOS", "format": "json"}, timeout=30)
-        r.raise_for_status()
-        data = r.json()
+        data = get_json_revalidated(url, params={"ids": "KBOS", "format": "json"}, timeout=30)
         
         if not data or len(data) == 0:
             raise ValueError("No data returned")
@@ -130,7 +161,7 @@ def fetch_kbos_obs():
         cloud_low, cloud_mid, cloud_high = _metar_cloud_splits_pct(obs.get("clouds"))
         result = {
             "station": obs.get("icaoId"),
-            "temp_f": round(temp_c * 9/5 + 32, 1) if temp_c is not None else None,
+            "temp_f": _c_to_f(temp_c),
             "dewpoint_c": obs.get("dewp"),
             "pressure_hpa": obs.get("altim"),
             "pressure_tend_hpa": obs.get("presTend"),
@@ -161,9 +192,7 @@ def fetch_kbvy_obs():
     
     try:
         url = "https://aviationweather.gov/api/data/metar"
-        r = requests.get(url, params={"ids": "KBVY", "format": "json"}, timeout=30)
-        r.raise_for_status()
-        data = r.json()
+        data = get_json_revalidated(url, params={"ids": "KBVY", "format": "json"}, timeout=30)
         
         if not data or len(data) == 0:
             raise ValueError("No data returned")
@@ -174,7 +203,7 @@ def fetch_kbvy_obs():
         cloud_low, cloud_mid, cloud_high = _metar_cloud_splits_pct(obs.get("clouds"))
         result = {
             "station": obs.get("icaoId"),
-            "temp_f": round(temp_c * 9/5 + 32, 1) if temp_c is not None else None,
+            "temp_f": _c_to_f(temp_c),
             "dewpoint_c": obs.get("dewp"),
             "pressure_hpa": obs.get("altim"),
             "wind_speed_kt": obs.get("wspd"),
@@ -197,14 +226,41 @@ def fetch_kbvy_obs():
         return None, meta
 
 
+# NDBC realtime2 column → output key, in payload order.
+_NDBC_FIELDS = (
+    ("WDIR", "wind_dir"),
+    ("WSPD", "wind_speed_ms"),      # m/s
+    ("GST",  "gust_ms"),            # m/s
+    ("WVHT", "wave_ht_m"),          # meters
+    ("DPD",  "wave_period_sec"),    # dominant wave period, sec
+    ("PRES", "pressure_hpa"),
+    ("ATMP", "air_temp_c"),
+    ("WTMP", "water_temp_c"),
+    ("DEWP", "dewpoint_c"),
+    ("PTDY", "pressure_tend_hpa"),
+)
+
+
+def _ndbc_float(val):
+    """NDBC value → float; None for the 'MM' missing sentinel or blanks."""
+    return float(val) if val and val != 'MM' else None
+
+
 def _fetch_single_buoy(buoy_id):
     """Fetch a single buoy's latest observation from NDBC real-time text data."""
     try:
         url = f"https://www.ndbc.noaa.gov/data/realtime2/{buoy_id}.txt"
-        r = requests.get(url, timeout=30)
-        r.raise_for_status()
-        
-        lines = r.text.strip().split('\n')
+        # The realtime2 file carries ~45 days of history, newest first; we
+        # only need header + units + latest row, so stream and stop early.
+        with SESSION.get(url, timeout=30, stream=True) as r:
+            r.raise_for_status()
+            r.encoding = r.encoding or "ascii"
+            lines = []
+            for line in r.iter_lines(decode_unicode=True):
+                if line and line.strip():
+                    lines.append(line)
+                    if len(lines) == 3:
+                        break
         if len(lines) < 3:
             raise ValueError("Insufficient data in response")
         
@@ -212,42 +268,18 @@ def _fetch_single_buoy(buoy_id):
         headers = lines[0].split()
         data = lines[2].split()
         
-        # Create dict mapping header -> value
+        # Create dict mapping header -> value (one pass; columns are then
+        # resolved by name, so a reordered header can't shift values)
         obs = dict(zip(headers, data))
         
-        # Helper to convert value, return None if MM (missing)
-        def to_float(val):
-            return float(val) if val and val != 'MM' else None
-        
-        # Extract and convert values
-        wind_dir = to_float(obs.get('WDIR'))
-        wind_speed_ms = to_float(obs.get('WSPD'))  # m/s
-        gust_ms = to_float(obs.get('GST'))  # m/s
-        wave_ht_m = to_float(obs.get('WVHT'))  # meters
-        wave_period = to_float(obs.get('DPD'))  # dominant wave period, sec
-        pressure_hpa = to_float(obs.get('PRES'))
-        air_temp_c = to_float(obs.get('ATMP'))
-        water_temp_c = to_float(obs.get('WTMP'))
-        dewpoint_c = to_float(obs.get('DEWP'))
-        pressure_tend = to_float(obs.get('PTDY'))
-        
         # Get timestamp from data
         yr, mo, dy, hr, mn = obs.get('#YY'), obs.get('MM'), obs.get('DD'), obs.get('hh'), obs.get('mm')
         time_str = f"{yr}-{mo.zfill(2)}-{dy.zfill(2)}T{hr.zfill(2)}:{mn.zfill(2)}Z"
         
-        return {
-            "time": time_str,
-            "wind_dir": wind_dir,
-            "wind_speed_ms": wind_speed_ms,
-            "gust_ms": gust_ms,
-            "wave_ht_m": wave_ht_m,
-            "wave_period_sec": wave_period,
-            "pressure_hpa": pressure_hpa,
-            "air_temp_c": air_temp_c,
-            "water_temp_c": water_temp_c,
-            "dewpoint_c": dewpoint_c,
-            "pressure_tend_hpa": pressure_tend
-        }
+        result = {"time": time_str}
+        for col, key in _NDBC_FIELDS:
+            result[key] = _ndbc_float(obs.get(col))
+        return result
     except Exception as e:
         logging.error(f"  ✗ {buoy_id}: {redact_secrets(e)}")
         return None
@@ -259,9 +291,12 @@ def fetch_buoy_44013():
     meta = {"status": "error", "updated_at": iso_utc_now(), "error": None}
     
     try:
-        # Fetch both buoys
-        buoy_13 = _fetch_single_buoy("44013")
-        buoy_98 = _fetch_single_buoy("44098")
+        # Fetch both buoys concurrently (independent NDBC files)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_13 = executor.submit(_fetch_single_buoy, "44013")
+            future_98 = executor.submit(_fetch_single_buoy, "44098")
+            buoy_13 = future_13.result()
+            buoy_98 = future_98.result()
         
         if not buoy_13 and not buoy_98:
             raise ValueError("Both buoys failed to fetch")
@@ -333,27 +368,7 @@ def fetch_buoy_44013():
             result = buoy_98.copy()
             logging.error("  ⚠ Using 44098 only (44013 failed)")
         
-        # Convert to final units
-        wind_speed_ms = result.get('wind_speed_ms')
-        gust_ms = result.get('gust_ms')
-        wave_ht_m = result.get('wave_ht_m')
-        air_temp_c = result.get('air_temp_c')
-        water_temp_c = result.get('water_temp_c')
-        dewpoint_c = result.get('dewpoint_c')
-        
-        final_result = {
-            "time": result.get('time'),
-            "wind_dir": result.get('wind_dir'),
-            "wind_mph": round(wind_speed_ms * 2.23694, 1) if wind_speed_ms else None,
-            "gust_mph": round(gust_ms * 2.23694, 1) if gust_ms else None,
-            "wave_ht_ft": round(wave_ht_m * 3.28084, 1) if wave_ht_m else None,
-            "wave_period_sec": result.get('wave_period_sec'),
-            "pressure_hpa": result.get('pressure_hpa'),
-            "air_temp_f": round(air_temp_c * 9/5 + 32, 1) if air_temp_c else None,
-            "water_temp_f": round(water_temp_c * 9/5 + 32, 1) if water_temp_c else None,
-            "dewpoint_f": round(dewpoint_c * 9/5 + 32, 1) if dewpoint_c else None,
-            "pressure_tend_hpa": result.get('pressure_tend_hpa')
-        }
+        final_result = _buoy_final_units(result)
         
         meta["status"] = "ok"
         logging.info(f"  ✓ Buoy: {final_result.get('air_temp_f')}°F air, {final_result.get('water_temp_f')}°F water, {final_result.get('wave_ht_ft')} ft waves, {final_result.get('wave_period_sec')}s period")
@@ -1,13 +1,24 @@
 """
 Fetch NWS data: alerts and gridpoint forecasts (BOX/76,97)
 """
-import requests
 from ..config import LAT, LON
 from ..utils import iso_utc_now, redact_secrets
+from .http import get_json_revalidated
 import logging
 
 HEADERS = {"User-Agent": "WymanCoveWeather/1.0"}
 GRIDPOINT_URL = "https://api.weather.gov/gridpoints/BOX/76,97"
+ALERTS_URL = f"https://api.weather.gov/alerts/active?point={LAT},{LON}"
+
+# Alert feature properties copied through as-is: (key, default)
+_ALERT_FIELDS = (
+    ("event", "Unknown"),
+    ("headline", ""),
+    ("description", ""),
+    ("severity", "Unknown"),
+    ("onset", ""),
+    ("expires", ""),
+)
 
 
 def fetch_nws_alerts():
@@ -16,10 +27,7 @@ def fetch_nws_alerts():
     meta = {"status": "error", "updated_at": iso_utc_now(), "error": None}
 
     try:
-        url = f"https://api.weather.gov/alerts/active?point={LAT},{LON}"
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        r.raise_for_status()
-        data = r.json()
+        data = get_json_revalidated(ALERTS_URL, headers=HEADERS, timeout=30)
 
         features = data.get("features", [])
 
@@ -38,15 +46,9 @@ def fetch_nws_alerts():
                 f"&product1={event_type}"
                 f"&lat={LAT}&lon={LON}"
             )
-            alerts.append({
-                "event": props.get('event', 'Unknown'),
-                "headline": props.get('headline', ''),
-                "description": props.get('description', ''),
-                "severity": props.get('severity', 'Unknown'),
-                "onset": props.get('onset', ''),
-                "expires": props.get('expires', ''),
-                "url": web_url
-            })
+            alert = {key: props.get(key, default) for key, default in _ALERT_FIELDS}
+            alert["url"] = web_url
+            alerts.append(alert)
 
         meta["status"] = "ok"
         logging.info(f"  ✓ NWS alerts: {len(alerts)} active")
@@ -64,9 +66,7 @@ def fetch_nws_gridpoints():
     meta = {"status": "error", "updated_at": iso_utc_now(), "error": None}
 
     try:
-        r = requests.get(GRIDPOINT_URL, headers=HEADERS, timeout=30)
-        r.raise_for_status()
-        data = r.json()
+        data = get_json_revalidated(GRIDPOINT_URL, headers=HEADERS, timeout=30)
 
         properties = data.get("properties", {})
         result = {
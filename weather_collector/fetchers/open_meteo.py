@@ -1,25 +1,82 @@
 """
 Fetch weather data from Open-Meteo API (GFS, HRRR, ECMWF models)
 """
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import requests
 
 from ..config import (
-    LAT, LON, OM_BASE_URL, OM_UNITS, HEADERS_DEFAULT,
+    LAT, LON, OM_BASE_URL, OM_UNITS,
     HRRR_HOURLY_VARS, GFS_ADDITIONAL_HOURLY_VARS, CURRENT_VARS, DAILY_VARS
 )
-from ..utils import iso_utc_now, redact_secrets
+from ..utils import iso_utc_now, loads_json, redact_secrets
+from .http import SESSION
 import logging
 
 
+# Request params are fixed per deploy — build them once at import.
+_BASE_PARAMS = {"latitude": LAT, "longitude": LON, **OM_UNITS}
+
+_GFS_CURRENT_PARAMS = {**_BASE_PARAMS, "current": ",".join(CURRENT_VARS)}
+
+_HRRR_HOURLY_PARAMS = {
+    **_BASE_PARAMS,
+    "hourly": ",".join(HRRR_HOURLY_VARS),
+    "forecast_hours": 48,
+    "past_hours": 0,
+}
+_HRRR_HOURLY_FALLBACK_PARAMS = {
+    **_HRRR_HOURLY_PARAMS,
+    "hourly": ",".join(HRRR_HOURLY_VARS + GFS_ADDITIONAL_HOURLY_VARS),
+}
+
+# Current conditions and the 48h hourly both use Open-Meteo's default model
+# selection, so one request can carry both blocks.
+_CURRENT_HOURLY_PARAMS = {**_HRRR_HOURLY_PARAMS, "current": _GFS_CURRENT_PARAMS["current"]}
+
+_ECMWF_DAILY_PARAMS = {
+    **_BASE_PARAMS,
+    "daily": ",".join(DAILY_VARS),
+    "models": "ecmwf_ifs025",
+    "forecast_days": 10,
+}
+_ECMWF_DAILY_FALLBACK_PARAMS = {k: v for k, v in _ECMWF_DAILY_PARAMS.items() if k != "models"}
+
+_GFS_7DAY_PARAMS = {
+    **_BASE_PARAMS,
+    "hourly": ",".join(HRRR_HOURLY_VARS + GFS_ADDITIONAL_HOURLY_VARS),
+    "forecast_days": 7,
+    "models": "gfs_seamless",
+}
+
+_HRRR_DAILY_TEMPS_PARAMS = {
+    **_BASE_PARAMS,
+    "hourly": "temperature_2m",
+    "forecast_hours": 48,
+    "past_hours": 24,
+}
+
+
+# Open-Meteo's rate-limit response. Fallback calls would only add load to
+# an API that is already refusing us, so they are skipped until next run.
+_RATE_LIMITED = 429
+
+
+def _rate_limited(meta):
+    return meta.get("http_status") == _RATE_LIMITED
 
 
 def _om_get(params, label):
-    """GET from Open-Meteo with standard error handling."""
+    """GET from Open-Meteo with standard error handling.
+    On an HTTP error the status code is recorded in meta["http_status"]."""
     meta = {"status": "error", "updated_at": iso_utc_now(), "error": None, "model": label}
     try:
-        r = requests.get(OM_BASE_URL, params=params, headers=HEADERS_DEFAULT, timeout=30)
+        r = SESSION.get(OM_BASE_URL, params=params, timeout=30)
+        if r.status_code >= 400:
+            meta["http_status"] = r.status_code
         r.raise_for_status()
-        data = r.json()
+        data = loads_json(r.content)
         if data.get("error"):
             raise ValueError(data.get("reason", str(data["error"])))
         meta["status"] = "ok"
@@ -34,54 +91,65 @@ def _om_get(params, label):
 def fetch_current_gfs():
     """Fetch current conditions from GFS."""
     logging.info("📡 Fetching current conditions (GFS)...")
-    params = {
-        "latitude": LAT,
-        "longitude": LON,
-        "current": ",".join(CURRENT_VARS),
-        **OM_UNITS,
-    }
-    return _om_get(params, "GFS current")
+    return _om_get(_GFS_CURRENT_PARAMS, "GFS current")
 
 
 def fetch_hourly_hrrr():
     """Fetch 48h hourly forecast from HRRR, fallback to GFS."""
     logging.info("📡 Fetching 48h hourly (HRRR)...")
-    hrrr_hourly = ",".join(HRRR_HOURLY_VARS)
-    params = {
-        "latitude": LAT,
-        "longitude": LON,
-        "hourly": hrrr_hourly,
-        "forecast_hours": 48,
-        "past_hours": 0,
-        **OM_UNITS,
-    }
-    data, meta = _om_get(params, "HRRR hourly")
-    if data is None:
+    data, meta = _om_get(_HRRR_HOURLY_PARAMS, "HRRR hourly")
+    if data is None and _rate_limited(meta):
+        logging.warning("  ⚠️  Open-Meteo rate-limited — skipping GFS fallback")
+    elif data is None:
         logging.warning("  ⚠️  HRRR unavailable — falling back to GFS seamless")
-        gfs_hourly = ",".join(HRRR_HOURLY_VARS + GFS_ADDITIONAL_HOURLY_VARS)
-        fb = {k: v for k, v in params.items() if k != "models"}
-        fb["hourly"] = gfs_hourly
-        data, meta = _om_get(fb, "GFS seamless (HRRR fallback)")
+        data, meta = _om_get(_HRRR_HOURLY_FALLBACK_PARAMS, "GFS seamless (HRRR fallback)")
     return data, meta
 
 
+def _split_response(data, drop):
+    """Copy of an Open-Meteo response without the given top-level blocks."""
+    return {k: v for k, v in data.items() if k not in drop}
+
+
+def fetch_current_and_hourly():
+    """
+    Fetch current conditions and 48h hourly in a single Open-Meteo call.
+
+    The combined response is split into the same two shapes
+    fetch_current_gfs() and fetch_hourly_hrrr() return, so callers see
+    no difference. If the combined call fails, or comes back missing
+    either block, falls back to the two separate fetchers (the hourly one
+    keeps its own GFS seamless fallback). A 429 skips the fallbacks and
+    returns (None, meta) for both, so a rate-limited API isn't hit again.
+
+    Returns:
+        ((current_data, current_meta), (hourly_data, hourly_meta))
+    """
+    logging.info("📡 Fetching current conditions + 48h hourly...")
+    data, meta = _om_get(_CURRENT_HOURLY_PARAMS, "GFS current + HRRR hourly")
+    if data is not None and data.get("current") and data.get("hourly"):
+        current = _split_response(data, ("hourly", "hourly_units"))
+        hourly = _split_response(data, ("current", "current_units"))
+        return (current, {**meta, "model": "GFS current"}), (hourly, {**meta, "model": "HRRR hourly"})
+
+    if data is None and _rate_limited(meta):
+        logging.warning("  ⚠️  Open-Meteo rate-limited — skipping separate current/hourly calls")
+        return (None, {**meta, "model": "GFS current"}), (None, {**meta, "model": "HRRR hourly"})
+
+    logging.warning("  ⚠️  Combined current/hourly call failed — fetching separately")
+    return fetch_current_gfs(), fetch_hourly_hrrr()
+
+
 def fetch_daily_ecmwf():
     """Fetch 10-day daily forecast from ECMWF, fallback to GFS."""
     logging.info("📡 Fetching 10-day daily (ECMWF)...")
-    params = {
-        "latitude": LAT,
-        "longitude": LON,
-        "daily": ",".join(DAILY_VARS),
-        "models": "ecmwf_ifs025",
-        "forecast_days": 10,
-        **OM_UNITS,
-    }
-    data, meta = _om_get(params, "ECMWF daily")
-    if data is None:
+    data, meta = _om_get(_ECMWF_DAILY_PARAMS, "ECMWF daily")
+    if data is None and _rate_limited(meta):
+        logging.warning("  ⚠️  Open-Meteo rate-limited — skipping GFS fallback")
+    elif data is None:
         logging.warning("  ⚠️  ECMWF unavailable — falling back to GFS seamless")
-        fb = {k: v for k, v in params.items() if k != "models"}
         logging.warning("  ⏳ Attempting GFS fallback...")
-        data, meta = _om_get(fb, "GFS seamless (ECMWF fallback)")
+        data, meta = _om_get(_ECMWF_DAILY_FALLBACK_PARAMS, "GFS seamless (ECMWF fallback)")
         if data is None:
             logging.error("  ✗ GFS fallback also failed - no daily forecast available")
     return data, meta
@@ -93,12 +161,7 @@ def fetch_directional_clouds(lat, lon, bearing_deg, distances_miles, skip_retry=
     skip_retry: if True, don't retry on timeout (used for warmup calls)
     Returns: dict with cloud data at each distance
     """
-    from ..config import OM_BASE_URL, OM_UNITS, HEADERS_DEFAULT
     from ..processors.sunset_directional import calculate_offset_lat_lon
-    from ..utils import iso_utc_now
-    import requests
-    import time
-    from concurrent.futures import ThreadPoolExecutor, as_completed
     
     logging.info(f"  📡 Fetching clouds at {bearing_deg}° bearing: {distances_miles} miles...")
     
@@ -114,9 +177,9 @@ def fetch_directional_clouds(lat, lon, bearing_deg, distances_miles, skip_retry=
         max_attempts = 1 if skip_retry else 2
         for attempt in range(max_attempts):
             try:
-                r = requests.get(OM_BASE_URL, params=params, headers=HEADERS_DEFAULT, timeout=10)
+                r = SESSION.get(OM_BASE_URL, params=params, timeout=10)
                 r.raise_for_status()
-                data = r.json()
+                data = loads_json(r.content)
                 if data.get("hourly"):
                     logging.info(f"    ✓ {dist}mi ({new_lat}, {new_lon})")
                     return f"{dist}mi", {
@@ -165,28 +228,11 @@ def fetch_hourly_gfs_7day():
     0-48h window so the comparison is meaningful.
     """
     logging.info("📡 Fetching 7-day hourly (GFS)...")
-    gfs_hourly = ",".join(HRRR_HOURLY_VARS + GFS_ADDITIONAL_HOURLY_VARS)
-    params = {
-        "latitude": LAT,
-        "longitude": LON,
-        "hourly": gfs_hourly,
-        "forecast_days": 7,
-        "models": "gfs_seamless",
-        **OM_UNITS,
-    }
-    return _om_get(params, "GFS 7-day hourly")
+    return _om_get(_GFS_7DAY_PARAMS, "GFS 7-day hourly")
 
 
 def fetch_hrrr_daily_temps():
     """Fetch today's full hourly temps (past+forward) for daily high/low computation."""
     logging.info("📡 Fetching HRRR daily temps (past+forward)...")
-    params = {
-        "latitude": LAT,
-        "longitude": LON,
-        "hourly": "temperature_2m",
-        "forecast_hours": 48,
-        "past_hours": 24,
-        **OM_UNITS,
-    }
-    data, meta = _om_get(params, "HRRR daily temps")
+    data, meta = _om_get(_HRRR_DAILY_TEMPS_PARAMS, "HRRR daily temps")
     return data, meta
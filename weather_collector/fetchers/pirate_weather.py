@@ -5,7 +5,8 @@ https://pirateweather.net
 """
 import os
 import requests
-from ..utils import redact_secrets
+from ..utils import loads_json, redact_secrets
+from .http import SESSION
 
 API_KEY = os.environ["PIRATE_WEATHER_API_KEY"]
 LAT = 42.5014
@@ -28,9 +29,9 @@ def fetch_pirate_weather():
     }
 
     try:
-        resp = requests.get(url, params=params, timeout=10)
+        resp = SESSION.get(url, params=params, timeout=10)
         resp.raise_for_status()
-        raw = resp.json()
+        raw = loads_json(resp.content)
 
         # --- Minutely block (next 60 minutes) ---
         minutely_raw = raw.get("minutely", {}).get("data", [])
@@ -1,55 +1,114 @@
 """
 Fetch current conditions from Weather Underground Personal Weather Station
 """
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
-from pathlib import Path
+import re
+from datetime import datetime, timezone
 
 from ..config import PWS_STATION, PWS_CACHE_FILE
-from ..utils import iso_utc_now, safe_float, load_json, save_json, redact_secrets
+from ..utils import iso_utc_now, safe_float, load_json, save_json, redact_secrets, compute_age_minutes
+from .http import SESSION
 import logging
 
 
+# Current temperature lives in <span class="wu-value wu-value-to">71.2</span>.
+# Matching that one span on the raw bytes avoids building a DOM for ~500 KB
+# of HTML and skips the UTF-8 decode.
+_PWS_TEMP_RE = re.compile(
+    rb'<span[^>]*class="[^"]*\bwu-value-to\b[^"]*"[^>]*>\s*(-?[0-9.]+)'
+)
+
+
+PWS_URL = f"https://www.wunderground.com/weather/us/ma/marblehead/{PWS_STATION}"
+# WU serves the dashboard HTML only to browser-looking clients.
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+}
+
+
+# Cache ages (minutes). The collector runs every 10 min; PWS is a fallback
+# source, so one scrape per ~2 runs is plenty, and a reading older than
+# PWS_MAX_STALE_MINUTES is worse than none.
+PWS_FRESH_MINUTES = 15
+PWS_MAX_STALE_MINUTES = 360
+
+# HTTP validators persisted alongside the cached reading so the next scrape
+# can be a conditional GET. Kept out of the returned pws dict.
+_VALIDATOR_KEYS = ("etag", "last_modified")
+
+
+def _parse_pws_temperature(html):
+    """Extract the current temperature from WU dashboard HTML bytes, or None."""
+    m = _PWS_TEMP_RE.search(html)
+    return safe_float(m.group(1).decode("ascii")) if m else None
+
+
+def _cached_reading(last, stale):
+    """Cached pws dict minus the HTTP validators, flagged stale or not."""
+    out = {k: v for k, v in last.items() if k not in _VALIDATOR_KEYS}
+    out["stale"] = stale
+    return out
 
 
 def fetch_pws_current():
     """
     Scrape current conditions from Weather Underground PWS.
-    Falls back to cached value if scrape fails.
+
+    Stale-while-revalidate on the instance cache: a reading younger than
+    PWS_FRESH_MINUTES is served without a request; anything older is
+    revalidated (conditional GET), and on a failed scrape a reading up to
+    PWS_MAX_STALE_MINUTES old is served flagged stale.
     """
     logging.info("📡 Fetching Castle Hill PWS...")
 
-    url = f"https://www.wunderground.com/weather/us/ma/marblehead/{PWS_STATION}"
-    meta = {"status": "error", "updated_at": iso_utc_now(), "error": None}
+    now_iso = iso_utc_now()
+    meta = {"status": "error", "updated_at": now_iso, "error": None}
 
     cache_path = PWS_CACHE_FILE
     last = load_json(cache_path)
+    has_cached = isinstance(last, dict) and last.get("temperature") is not None
+    age = compute_age_minutes(last.get("updated"), datetime.now(timezone.utc)) if has_cached else None
+
+    if age is not None and 0 <= age < PWS_FRESH_MINUTES:
+        meta.update(status="ok", updated_at=last["updated"], cached=True)
+        logging.info(f"✓ PWS: {last['temperature']}°F (cached, {age:.0f} min old)")
+        return _cached_reading(last, stale=False), meta
 
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        r = requests.get(url, headers=headers, timeout=30)
+        headers = dict(_HEADERS)
+        if has_cached:
+            if last.get("etag"):
+                headers["If-None-Match"] = last["etag"]
+            if last.get("last_modified"):
+                headers["If-Modified-Since"] = last["last_modified"]
+        r = SESSION.get(PWS_URL, headers=headers, timeout=30)
+
+        if r.status_code == 304 and has_cached:
+            # Server confirmed the page is unchanged — cached reading is current
+            save_json(cache_path, {**last, "updated": now_iso})
+            pws_data = _cached_reading({**last, "updated": now_iso}, stale=False)
+            meta["status"] = "ok"
+            meta["not_modified"] = True
+            logging.info(f"✓ PWS: {pws_data['temperature']}°F (not modified)")
+            return pws_data, meta
+
         r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
 
         pws_data = {
             "station": PWS_STATION,
             "name": "Castle Hill",
-            "updated": datetime.now().isoformat(),
-            "temperature": None,
+            "updated": now_iso,
+            "temperature": _parse_pws_temperature(r.content),
             "stale": False
         }
 
-        temp_elem = soup.find("span", class_="wu-value wu-value-to")
-        if temp_elem:
-            pws_data["temperature"] = safe_float(temp_elem.text.strip())
-
         if pws_data["temperature"] is None:
             raise RuntimeError("Could not parse PWS temperature (WU DOM likely changed).")
 
-        save_json(cache_path, pws_data)
+        save_json(cache_path, {
+            **pws_data,
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+        })
 
         meta["status"] = "ok"
         logging.info(f"✓ PWS: {pws_data['temperature']}°F")
@@ -59,10 +118,8 @@ def fetch_pws_current():
         meta["error"] = redact_secrets(e)
         logging.error(f"✗ PWS error: {redact_secrets(e)}")
 
-        if last and isinstance(last, dict) and last.get("temperature") is not None:
-            last_copy = dict(last)
-            last_copy["stale"] = True
-            return last_copy, meta
+        if age is not None and age <= PWS_MAX_STALE_MINUTES:
+            return _cached_reading(last, stale=True), meta
 
         return {
             "station": PWS_STATION, 
@@ -70,4 +127,4 @@ def fetch_pws_current():
             "updated": None, 
             "temperature": None, 
             "stale": True
-        }, meta
\ No newline at end of file
+        }, meta
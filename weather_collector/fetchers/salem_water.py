@@ -3,12 +3,11 @@ Fetch Salem Harbor water temperature.
 Primary: GoMOFS model (NOAA Gulf of Maine OFS) at ny=392, nx=101 (42.50N, -70.88W)
 Fallback: NOAA buoy 44013 scraped from NDBC
 """
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta, timezone
 
-from ..config import HEADERS_DEFAULT
 from ..utils import safe_float, redact_secrets
+from .http import SESSION
 import logging
 
 
@@ -62,7 +61,7 @@ def _fetch_gomofs_temp():
         full_url = base_url + query
         fname = base_url.split('/')[-1]
         try:
-            r = requests.get(full_url, headers=HEADERS_DEFAULT, timeout=30)
+            r = SESSION.get(full_url, timeout=30)
             if r.status_code == 404:
                 logging.info(f"  - GoMOFS {fname}: 404, skipping")
                 continue
@@ -82,7 +81,7 @@ def _fetch_gomofs_temp():
 def _fetch_buoy_temp():
     url = "https://www.ndbc.noaa.gov/station_page.php?station=44013"
     try:
-        r = requests.get(url, headers=HEADERS_DEFAULT, timeout=30)
+        r = SESSION.get(url, timeout=30)
         r.raise_for_status()
         soup = BeautifulSoup(r.text, "html.parser")
         for row in soup.find_all("tr"):
@@ -8,10 +8,9 @@ import math
 import re
 import time
 
-import requests
-
 from ..config import LAT, LON
 from ..utils import iso_utc_now
+from .http import SESSION
 import logging
 
 # Public Tempest stations within ~2.5mi of Wyman Cove (expanded from 1.5mi
@@ -95,8 +94,8 @@ def _haversine_mi(lat1, lon1, lat2, lon2):
 
 def _fetch_station(sid):
     url = _BASE_URL.format(sid=sid)
-    r = requests.get(url, params={"callback": "cb", "api_key": _API_KEY},
-                     headers=_HEADERS, timeout=10)
+    r = SESSION.get(url, params={"callback": "cb", "api_key": _API_KEY},
+                    headers=_HEADERS, timeout=10)
     r.raise_for_status()
     m = re.match(r"cb\((.*)\)$", r.text.strip(), re.DOTALL)
     if not m:
@@ -1,83 +1,94 @@
 """
 Fetch tide predictions from NOAA
 """
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from ..config import TIDE_STATION
 from ..utils import iso_utc_now, redact_secrets
+from .http import get_json_revalidated
 import logging
 
+TZ = ZoneInfo("America/New_York")
 
+TIDES_URL = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter"
+# Predictions for a fixed date window don't change; the window itself rolls
+# daily, which changes the cache key. An hour keeps warm instances from
+# re-asking while still picking up any NOAA correction the same day.
+TIDES_MAX_AGE = 3600
+# Everything but the product interval and date window is fixed per station.
+_BASE_PARAMS = {
+    "station": TIDE_STATION,
+    "product": "predictions",
+    "datum": "MLLW",
+    "time_zone": "lst_ldt",
+    "units": "english",
+    "format": "json",
+}
 
 
 def fetch_tides():
     """
     Fetch tide predictions from NOAA.
-    Makes two calls:
-      1. High/low events (hilo product) — capped at 8, used for tile display
+    Makes two calls, issued concurrently (same host, independent queries):
+      1. High/low events (hilo product) — capped at 12, used for tile display
       2. 6-minute interval curve (predictions product) — 48h, used for chart
     """
     logging.info("📡 Fetching NOAA tides...")
 
-    url = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter"
-    today = datetime.now(ZoneInfo("America/New_York"))
+    today = datetime.now(TZ)
     begin = today.strftime("%Y%m%d")
     end = (today + timedelta(days=3)).strftime("%Y%m%d")
-    base = {
-        "station": TIDE_STATION,
-        "datum": "MLLW",
-        "time_zone": "lst_ldt",
-        "units": "english",
-        "format": "json",
-    }
-
     meta = {"status": "error", "updated_at": iso_utc_now(), "error": None}
 
     try:
-        # Call 1: High/low events
-        r1 = requests.get(url, params={**base, "product": "predictions", 
-                                        "interval": "hilo", 
-                                        "begin_date": begin, 
-                                        "end_date": end}, timeout=30)
-        r1.raise_for_status()
-        hilo_data = r1.json()
-
-        # Call 2: 6-minute curve (48h)
         begin_curve = today.replace(hour=0, minute=0, second=0, microsecond=0).strftime("%Y%m%d %H:%M")
-        end_curve = (today + timedelta(hours=72)).strftime("%Y%m%d %H:%M")
-        r2 = requests.get(url, params={**base, "product": "predictions",
-                                        "interval": "6",
-                                        "begin_date": begin_curve,
-                                        "end_date": end_curve}, timeout=30)
-        r2.raise_for_status()
-        curve_data = r2.json()
+        # Hour-aligned so the query (and its cache key) is stable within the hour
+        end_curve = (today.replace(minute=0, second=0, microsecond=0)
+                     + timedelta(hours=72)).strftime("%Y%m%d %H:%M")
+        hilo_params = {**_BASE_PARAMS,
+                       "interval": "hilo",
+                       "begin_date": begin,
+                       "end_date": end}
+        curve_params = {**_BASE_PARAMS,
+                        "interval": "6",
+                        "begin_date": begin_curve,
+                        "end_date": end_curve}
+
+        def _get(params):
+            return get_json_revalidated(TIDES_URL, params=params, timeout=30,
+                                        max_age=TIDES_MAX_AGE)
+
+        # Call 1: High/low events, Call 2: 6-minute curve (48h). Both in
+        # flight at once so the run pays one NOAA round-trip, not two.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            hilo_future = executor.submit(_get, hilo_params)
+            curve_future = executor.submit(_get, curve_params)
+            hilo_data = hilo_future.result()
+            curve_data = curve_future.result()
 
         # Build result - reformat events for UI
-        raw_events = hilo_data.get("predictions", [])[:12]
         events = []
-        for event in raw_events:
+        for event in hilo_data.get("predictions", [])[:12]:
             # NOAA format: {t: "2026-03-15 02:54", v: "1.957", type: "L"}
             # UI expects: {date: "2026-03-15", time: "02:54", height: "1.957", type: "L"}
-            timestamp = event.get("t", "")
-            if " " in timestamp:
-                date_part, time_part = timestamp.split(" ", 1)
-            else:
-                date_part, time_part = timestamp, "00:00"
-            
+            date_part, _, time_part = event.get("t", "").partition(" ")
             events.append({
                 "date": date_part,
-                "time": time_part,
+                "time": time_part or "00:00",
                 "height": event.get("v"),
                 "type": event.get("type"),
             })
 
         # Curve for chart - reformat times and heights
-        raw_curve = curve_data.get("predictions", [])
+        # One pass; points with a blank/missing time or height are dropped
+        # as a pair so the two arrays stay aligned.
+        pairs = [(t, float(v)) for c in curve_data.get("predictions", [])
+                 if (t := c.get("t")) and (v := c.get("v")) not in (None, "")]
         curve = {
-            "times": [c.get("t") for c in raw_curve],
-            "heights": [float(c.get("v", 0)) for c in raw_curve],
+            "times": [t for t, _ in pairs],
+            "heights": [h for _, h in pairs],
         }
 
         tide_result = {
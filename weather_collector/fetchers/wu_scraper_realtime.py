@@ -8,12 +8,12 @@ Intelligently aggregates data from 15 local stations with:
 - Quality scoring for each aggregate
 """
 
-import requests
 import json
 import time
 from datetime import datetime
 from math import radians, sin, cos, sqrt, atan2
-from ..utils import redact_secrets
+from ..utils import loads_json, redact_secrets
+from .http import SESSION
 
 # API Configuration
 import os
@@ -163,9 +163,9 @@ def get_current_observation(station_id):
     url = f"{BASE_URL}?apiKey={API_KEY}&stationId={station_id}&numericPrecision=decimal&format=json&units=e"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = loads_json(response.content)
         
         observations = data.get('observations', [])
         if not observations:
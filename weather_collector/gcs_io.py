@@ -6,14 +6,17 @@ logging the error at warning level. Uploading raises on failure so callers
 can decide whether to abort.
 """
 import gzip
-import json
 import logging
 
-from .utils import redact_secrets
+from .utils import dumps_json, loads_json, redact_secrets
 
 
 BUCKET = "myweather-data"
 
+# zlib's default level. On the float-heavy payloads it is ~2x faster than
+# gzip.compress()'s level 9 for <1% larger output.
+GZIP_LEVEL = 6
+
 
 def get_client():
     """Lazy-init GCS client. The google.cloud import is deferred because
@@ -22,8 +25,9 @@ def get_client():
     return storage.Client()
 
 
-def upload_json(data, gcs_path, label):
-    """Upload `data` as indented JSON to `gcs_path` with no-cache headers.
+def upload_json(data, gcs_path, label, indent=False):
+    """Upload `data` as gzipped JSON to `gcs_path` with no-cache headers.
+    Compact unless indent=True (2-space, for files people read by hand).
 
     Logs a sized success message at info level. Re-raises on failure so
     callers (e.g., the weather_data.json write) can fail the run.
@@ -35,8 +39,8 @@ def upload_json(data, gcs_path, label):
         # uncompressed format (weather_data.json: ~420KB → ~50KB). GCS serves
         # the bytes with Content-Encoding: gzip, browsers + iOS Safari + the
         # google-cloud-storage Python client all transparently decompress.
-        payload_json = json.dumps(data, separators=(",", ":"))
-        payload_gz = gzip.compress(payload_json.encode("utf-8"))
+        payload_json = dumps_json(data, indent=indent)
+        payload_gz = gzip.compress(payload_json, compresslevel=GZIP_LEVEL)
         blob.content_encoding = "gzip"
         blob.cache_control = "no-cache, max-age=0"
         blob.upload_from_string(payload_gz, content_type="application/json")
@@ -52,7 +56,7 @@ def load_json(gcs_path, default=None):
         client = get_client()
         blob = client.bucket(BUCKET).blob(gcs_path)
         if blob.exists():
-            return json.loads(blob.download_as_text())
+            return loads_json(blob.download_as_bytes())
     except Exception as e:
         logging.warning(f"  ⚠  Could not load {gcs_path} from GCS: {redact_secrets(e)}")
     return default
@@ -34,6 +34,8 @@ import json
 import logging
 from pathlib import Path
 
+from .state_stamp import synoptic_regime
+
 
 ENABLED = True   # v0.6.390 2026-07-30 — flipped early. Rerun of
                  # h_cc_derivation against the post-cl-field-kill regime
@@ -127,7 +129,7 @@ def stamp_cc_from_derivation(weather_data):
     cl_arr = hourly.get("cloud_cover_low")
     cm_arr = hourly.get("cloud_cover_mid")
     ch_arr = hourly.get("cloud_cover_high")
-    regime = ((weather_data.get("derived") or {}).get("state") or {}).get("regime_synoptic")
+    regime = synoptic_regime(weather_data)
 
     per_lead = {
         "enabled": ENABLED,
@@ -35,6 +35,8 @@ import json
 import logging
 from pathlib import Path
 
+from .state_stamp import synoptic_regime
+
 
 ENABLED = True  # Flipped 2026-07-19 v0.6.358 after 7-day gate cleared + refreshed-window rerun confirmed SHIP: 27 SHIP cells, halves A -17.84% / B -37.61%, regime_gate FULL -29.53%. Stage 2 preview shipped 2026-07-12.
 
@@ -167,7 +169,7 @@ def stamp_ch_persistence_gate(weather_data):
     table = _load_table()
     cells = table.get("cells", {})
 
-    regime = ((weather_data.get("derived") or {}).get("state") or {}).get("regime_synoptic") or "unknown"
+    regime = synoptic_regime(weather_data) or "unknown"
 
     persist_val, persist_src = _persistence_source(weather_data)
 
@@ -37,6 +37,8 @@ import json
 import logging
 from pathlib import Path
 
+from .state_stamp import synoptic_regime
+
 
 ENABLED = False  # Stage 3 shipped 2026-07-24 v0.6.379. Shadow-write bug fixed 2026-07-27 v0.6.382p (pre-fix: 7-day flip gate through 07-31 was reading zero real data). Gate EXTENDED to 2026-08-03 (7 full daily reads of post-fix shadow data). Flip only after 7 daily reads agree on SHIP cell set.
 
@@ -168,7 +170,7 @@ def stamp_cl_persistence_gate(weather_data):
     table = _load_table()
     cells = table.get("cells", {})
 
-    regime = ((weather_data.get("derived") or {}).get("state") or {}).get("regime_synoptic") or "unknown"
+    regime = synoptic_regime(weather_data) or "unknown"
 
     persist_val, persist_src = _persistence_source(weather_data)
 
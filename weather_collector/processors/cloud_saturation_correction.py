@@ -25,6 +25,8 @@ import json
 import logging
 from pathlib import Path
 
+from .state_stamp import synoptic_regime
+
 
 ENABLED = True  # Flipped 2026-07-17 v0.6.355 after 8/7-day gate clear, 16 SHIP cells stable, LC_ENABLED READY on divergence report, no cc/cl/cm/ch ANOMALY. Fit shipped 2026-07-04.
 
@@ -171,7 +173,7 @@ def stamp_cloud_saturation_correction(weather_data):
     hourly = weather_data.get("hourly") or {}
     table = _load_table()
     cells = table.get("cells", {})
-    regime = ((weather_data.get("derived") or {}).get("state") or {}).get("regime_synoptic")
+    regime = synoptic_regime(weather_data)
 
     per_field = {}
     for field in CLOUD_FIELDS:
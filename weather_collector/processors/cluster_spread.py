@@ -21,12 +21,11 @@ Stored as cluster_spread_log.json in GCS. 60-day retention.
 Stamps `weather_data["cluster_spread"]` for instant inspection on each
 tick (debug page can render it later).
 """
-import json
 import logging
 from datetime import datetime, timezone, timedelta
 from statistics import median, pstdev
 
-from ..utils import iso_utc_now, redact_secrets
+from ..utils import dumps_json, iso_utc_now, loads_json, redact_secrets
 
 GCS_PATH = "cluster_spread_log.json"
 RETENTION_DAYS = 60
@@ -102,13 +101,13 @@ def stamp_and_log(weather_data, wu_data, gcs_client, bucket_name):
     try:
         blob = gcs_client.bucket(bucket_name).blob(GCS_PATH)
         if blob.exists():
-            log = json.loads(blob.download_as_text())
+            log = loads_json(blob.download_as_bytes())
         else:
             log = {"entries": []}
         cutoff = (datetime.now(timezone.utc) - timedelta(days=RETENTION_DAYS)).isoformat()
         entries = [e for e in log.get("entries", []) if e.get("ts", "") >= cutoff]
         entries.append(entry)
-        blob.upload_from_string(json.dumps({"entries": entries}),
+        blob.upload_from_string(dumps_json({"entries": entries}),
                                 content_type="application/json")
     except Exception as e:
         logging.warning(f"  ⚠  cluster_spread log write failed: {redact_secrets(e)}")
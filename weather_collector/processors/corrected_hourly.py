@@ -14,6 +14,7 @@ all 48 lead hours, apply bias × exp(-lead/τ_field). τ is fit per field by
 analysis/l2_lead_decay_fit.py. Fields not in L2_TAUS (or τ ≥ 1e8) get
 flat application. Optional GCS override via l2_decay.json.
 """
+import logging
 import math
 
 from ..gcs_io import load_json
@@ -56,7 +57,6 @@ def _load_l2_taus():
     Otherwise, fall back to DEFAULT_L2_TAUS for that field. Field-level
     guardrails so a bad fit on one field doesn't take the others down with it.
     """
-    import logging
     doc = load_json(L2_DECAY_PATH, default=None)
     taus_out = {}
     meta_fields = {}
@@ -24,6 +24,8 @@ from datetime import datetime
 
 import pytz
 
+from .state_stamp import synoptic_regime
+
 
 TZ = pytz.timezone("America/New_York")
 ENABLED = False  # Shipped 2026-06-26; both branches disabled 2026-07-01 v0.6.276 (compute_cove_correction returns 0.0); top-level flag flipped 2026-07-03 so badges + applicability map + telemetry stop lying. Re-enable only after Fix B refit against L2 baseline.
@@ -271,7 +273,7 @@ def stamp_cove_correction(weather_data):
         import logging as _logging
         from . import gate_firing_log
         from ..utils import redact_secrets as _redact
-        regime = ((weather_data.get("derived") or {}).get("state") or {}).get("regime_synoptic")
+        regime = synoptic_regime(weather_data)
         would_fire = sum(1 for d in per_lead_deltas if d)
         gate_firing_log.record_firing(
             operator="Lt", regime=regime,
@@ -46,7 +46,7 @@ design violation. This processor restores the contract.
 """
 import logging
 
-from ..utils import get_weather_description, get_weather_emoji
+from ..utils import get_weather_info
 
 
 # hPa = inHg * 33.8639. Used to convert corrected_pressure_in (inHg in the
@@ -157,8 +157,7 @@ def sync_current_from_hourly_corrected(weather_data):
                                         current.get("precipitation"))
         if new_code is not None and new_code != raw_code:
             current["weather_code"] = new_code
-            current["weather_description"] = get_weather_description(new_code)
-            current["weather_emoji"] = get_weather_emoji(new_code)
+            current["weather_description"], current["weather_emoji"] = get_weather_info(new_code)
             synced.append(f"weather_code: {raw_code}→{new_code} ({current['weather_description']})")
 
     if synced:
@@ -17,6 +17,7 @@ import pytz
 # etc.) in the snapshot still equal the pre-decay L2 value so the Fitter's
 # decay-correction calibration is unchanged.
 from .obs_log import update_obs_temp_log
+from ..utils import hour_index
 
 
 TZ = pytz.timezone("America/New_York")
@@ -32,8 +33,8 @@ def _current_hour_precip_in(weather_data, current_hour_iso):
         return wu_rate
     times = weather_data["hourly"].get("times", [])
     precip_in = weather_data["hourly"].get("precipitation", [])
-    if current_hour_iso in times:
-        i = times.index(current_hour_iso)
+    i = hour_index(times, current_hour_iso)
+    if i is not None:
         if i < len(precip_in) and precip_in[i] is not None:
             return precip_in[i]
     return None
@@ -111,9 +112,9 @@ def _extract_atmospheric_now(weather_data, current_hour_iso):
     """Pull freezing level, precip water, low cloud cover for the current hour."""
     hourly = weather_data["hourly"]
     times = hourly.get("times", [])
-    if current_hour_iso not in times:
+    i = hour_index(times, current_hour_iso)
+    if i is None:
         return {}
-    i = times.index(current_hour_iso)
     out = {}
     fl = hourly.get("freezing_level_ft", [])
     pw = hourly.get("precip_water_mm", [])
@@ -1160,7 +1160,6 @@ def fit_decay_corrections():
     # metric differs from MAE. Frontend PP card reads this to render the
     # chart in the correct scoring rule.
     per_layer_brier_by_lead = {}
-    import math as _math
     for f in FIELDS:
         per_layer_mae_by_lead[f]  = {}
         per_layer_bias_by_lead[f] = {}
@@ -1182,7 +1181,7 @@ def fit_decay_corrections():
                 if n > 0:
                     mae_arr[lead]  = round(per_layer_abs[(f, lead, lyr)] / n, 3)
                     bias_arr[lead] = round(per_layer_signed[(f, lead, lyr)] / n, 3)
-                    rmse_arr[lead] = round(_math.sqrt(per_layer_sq[(f, lead, lyr)] / n), 3)
+                    rmse_arr[lead] = round(math.sqrt(per_layer_sq[(f, lead, lyr)] / n), 3)
             per_layer_mae_by_lead[f][lyr]  = mae_arr
             per_layer_bias_by_lead[f][lyr] = bias_arr
             per_layer_rmse_by_lead[f][lyr] = rmse_arr
@@ -1201,7 +1200,7 @@ def fit_decay_corrections():
             if n_p > 0:
                 prod_arr[lead]      = round(per_field_prod_abs[(f, lead)] / n_p, 3)
                 prod_bias_arr[lead] = round(per_field_prod_signed[(f, lead)] / n_p, 3)
-                prod_rmse_arr[lead] = round(_math.sqrt(per_field_prod_sq[(f, lead)] / n_p), 3)
+                prod_rmse_arr[lead] = round(math.sqrt(per_field_prod_sq[(f, lead)] / n_p), 3)
         per_layer_mae_by_lead[f]["production"]  = prod_arr
         per_layer_bias_by_lead[f]["production"] = prod_bias_arr
         per_layer_rmse_by_lead[f]["production"] = prod_rmse_arr
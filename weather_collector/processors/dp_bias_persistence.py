@@ -38,6 +38,9 @@ import logging
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+from .state_stamp import synoptic_regime
+from ..utils import dumps_json, loads_json
+
 
 ENABLED = True    # Flipped 2026-08-04 v0.6.391 after 7-day shadow-week clear. Stage 3 wired 2026-07-28 v0.6.387; Stage 1 halves-verified pre_frontal +17.2%, nw_flow +14.5%, sw_flow +14.6%.
 
@@ -89,7 +92,7 @@ def load_state(gcs_client, bucket_name):
     try:
         blob = gcs_client.bucket(bucket_name).blob(GCS_STATE_PATH)
         if blob.exists():
-            return json.loads(blob.download_as_text())
+            return loads_json(blob.download_as_bytes())
         logging.info("  ℹ  No dp_bias_antecedent_state.json yet (first run)")
     except Exception as e:
         logging.warning(f"  ⚠  dpbp state load failed: {e}")
@@ -99,7 +102,7 @@ def load_state(gcs_client, bucket_name):
 def save_state(state, gcs_client, bucket_name):
     try:
         blob = gcs_client.bucket(bucket_name).blob(GCS_STATE_PATH)
-        blob.upload_from_string(json.dumps(state), content_type="application/json")
+        blob.upload_from_string(dumps_json(state), content_type="application/json")
     except Exception as e:
         logging.warning(f"  ⚠  dpbp state save failed: {e}")
 
@@ -155,7 +158,7 @@ def _current_bias(weather_data):
     obs = (weather_data.get("current") or {}).get("dew_point")
     if fc_l1 is None or obs is None:
         return None, None
-    regime = ((weather_data.get("derived") or {}).get("state") or {}).get("regime_synoptic")
+    regime = synoptic_regime(weather_data)
     return (float(fc_l1) - float(obs)), regime
 
 
@@ -208,7 +211,7 @@ def stamp_dp_bias_persistence(weather_data, gcs_client=None, bucket_name=None):
     # forecast regime — use current derived regime as best proxy for lead-0;
     # more sophisticated versions would use state_fc per-lead. For MVP
     # we apply per-regime antecedent based on the run-time regime.
-    regime_curr = ((weather_data.get("derived") or {}).get("state") or {}).get("regime_synoptic")
+    regime_curr = synoptic_regime(weather_data)
 
     # Compute antecedent for each focus regime once (they don't change
     # per-lead; the fire condition depends on current regime + lead).
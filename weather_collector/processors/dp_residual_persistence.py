@@ -31,6 +31,8 @@ import json
 import logging
 from pathlib import Path
 
+from .state_stamp import synoptic_regime
+
 
 ENABLED = False  # Live-layer change gate: 7-day agreement + halves-stability + no-halves-flip before flipping True. Stage 2 preview shipped 2026-07-22.
 
@@ -154,7 +156,7 @@ def stamp_dp_residual_persistence(weather_data):
     hc_block = table.get("hourly_correction") or {}
     hour_corr = hc_block.get("hour_of_day") or {}
 
-    regime = ((weather_data.get("derived") or {}).get("state") or {}).get("regime_synoptic") or "unknown"
+    regime = synoptic_regime(weather_data) or "unknown"
 
     n_leads = len(arr)
     per_lead_would_apply = [None] * n_leads
@@ -16,6 +16,12 @@ HOURLY_HORIZON = 18
 DISSIPATION_THRESHOLD = 20
 
 
+def _window(arr, n):
+    """First n entries of arr, padded with None if it is shorter."""
+    head = list(arr[:n])
+    return head + [None] * (n - len(head))
+
+
 def _current_fog_inputs(weather_data):
     """Return (temp_f, dew_point_f, humidity, wind_mph, wind_dir) for the
     current moment. Prefers the cleaned GFS current; falls back to hourly[0]
@@ -66,6 +72,11 @@ def compute_fog_metrics(weather_data):
     # 2. 18-hour fog probability array (uses bias-corrected hourly arrays)
     h = weather_data.get("hourly", {})
     htimes  = h.get("times", [])
+    if not htimes:
+        # Degraded run with no hourly block — nothing to walk or dissipate.
+        derived["fog_hourly_prob"] = []
+        derived["fog_hourly_times"] = []
+        return
     htemps  = h.get("corrected_temperature", h.get("temperature", []))
     hdewpts = h.get("corrected_dew_point",   h.get("dew_point", []))
     hhumids = h.get("corrected_humidity",    h.get("humidity", []))
@@ -73,16 +84,19 @@ def compute_fog_metrics(weather_data):
     hwdirs  = h.get("wind_direction", [])
     hccl    = h.get("cloud_cover_low", [])
 
+    # Pad every input column to the window once, then walk them in lockstep
+    # instead of bounds-checking six arrays per hour.
+    n = min(HOURLY_HORIZON, len(htimes))
     probs = []
-    for i in range(min(HOURLY_HORIZON, len(htimes))):
+    for t, dp, rh_i, ws, wd, ccl in zip(
+        _window(htemps, n), _window(hdewpts, n), _window(hhumids, n),
+        _window(hwinds, n), _window(hwdirs, n), _window(hccl, n),
+    ):
         fr = calculate_fog_risk(
-            htemps[i]  if i < len(htemps)  else None,
-            hdewpts[i] if i < len(hdewpts)  else None,
-            hhumids[i] if i < len(hhumids)  else None,
-            hwinds[i]  if i < len(hwinds)   else None,
-            wind_direction=hwdirs[i] if i < len(hwdirs) else None,
+            t, dp, rh_i, ws,
+            wind_direction=wd,
             water_temp_f=water_temp_f,
-            cloud_cover_low_pct=hccl[i] if i < len(hccl) else None,
+            cloud_cover_low_pct=ccl,
         )
         probs.append(fr["fog_probability"] if fr else 0)
     derived["fog_hourly_prob"] = probs
@@ -5,9 +5,20 @@ Days 8-10: Simple daily summaries from ECMWF daily data
 Uses local time (America/New_York) to determine period boundaries.
 """
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 import pytz
 from .wind_risk import get_exposure_factor, worry_score, worry_level
 
+TZ = pytz.timezone("America/New_York")
+
+
+@lru_cache(maxsize=512)
+def _local_date_hour(time_str):
+    """(date, hour) of a naive local ISO timestamp. Memoized because every
+    one of the 14 periods re-scans the same ~168 hourly timestamps."""
+    dt = datetime.fromisoformat(time_str)
+    return dt.date(), dt.hour
+
 
 WEATHER_CODES = {
     0: "Clear", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
@@ -73,8 +84,7 @@ def generate_forecast_text(hourly_data, daily_data, nws_gridpoints=None, temp_bi
     if not hrrr_data or not daily_data:
         return []
     forecasts = []
-    eastern = pytz.timezone('America/New_York')
-    now_local = datetime.now(eastern)
+    now_local = datetime.now(TZ)
     current_hour = now_local.hour
     
     # Determine starting period for days 1-7
@@ -113,7 +123,7 @@ def generate_forecast_text(hourly_data, daily_data, nws_gridpoints=None, temp_bi
             target_date,
             is_daytime,
             period_name,
-            eastern,
+            TZ,
             nws_gridpoints,
             temp_bias=temp_bias if current_day_offset <= 1 else 0,
             derived=derived,
@@ -173,23 +183,25 @@ def _generate_period_forecast(hrrr_data, gfs_data, target_date, is_daytime, peri
     period_indices = []
     period_hours = []
     
+    next_date = target_date + timedelta(days=1)
     for i, time_str in enumerate(hourly_data.get('times', [])):
-        dt = eastern.localize(datetime.fromisoformat(time_str))
+        # Wall-clock date/hour; localizing wouldn't change either field
+        d, hour = _local_date_hour(time_str)
         
         # Check if this hour belongs to our period
         if is_daytime:
             # Daytime: 6 AM - 6 PM on target_date
-            if dt.date() == target_date and start_hour <= dt.hour < end_hour:
+            if d == target_date and start_hour <= hour < end_hour:
                 period_indices.append(i)
-                period_hours.append(dt.hour)
+                period_hours.append(hour)
         else:
             # Nighttime: 6 PM on target_date through 6 AM next day
-            if dt.date() == target_date and dt.hour >= start_hour:
+            if d == target_date and hour >= start_hour:
                 period_indices.append(i)
-                period_hours.append(dt.hour)
-            elif dt.date() == target_date + timedelta(days=1) and dt.hour < end_hour:
+                period_hours.append(hour)
+            elif d == next_date and hour < end_hour:
                 period_indices.append(i)
-                period_hours.append(dt.hour)
+                period_hours.append(hour)
     
     if not period_indices:
         return None
@@ -502,10 +514,7 @@ def _generate_daily_forecast(daily_data, target_date, derived=None):
 
     # Override with corrected derived values (single source of truth)
     if derived:
-        from datetime import datetime, timedelta
-        import pytz
-        eastern = pytz.timezone("America/New_York")
-        now = datetime.now(eastern)
+        now = datetime.now(TZ)
         today_str = now.strftime("%Y-%m-%d")
         tomorrow_str = (now + timedelta(days=1)).strftime("%Y-%m-%d")
         target_str = target_date.isoformat()
@@ -2,12 +2,13 @@
 Frost/freeze tracking - season-to-date counts with historical backfill.
 Season = Oct 1 through Sep 30.
 """
-import json
-import requests
-from datetime import datetime, timezone, timedelta
+import bisect
+from datetime import date, datetime, timezone, timedelta
 from pathlib import Path
 
 from ..config import LAT, LON, FROST_LOG_FILE
+from ..fetchers.http import SESSION
+from ..utils import load_json, loads_json, save_json
 import logging
 
 
@@ -19,9 +20,9 @@ def fetch_historical_mins(season_start, today_str):
             f"&start_date={season_start}&end_date={today_str}"
             f"&daily=temperature_2m_min&temperature_unit=fahrenheit&timezone=America/New_York"
         )
-        resp = requests.get(url, timeout=20)
+        resp = SESSION.get(url, timeout=20)
         resp.raise_for_status()
-        data = resp.json()
+        data = loads_json(resp.content)
         dates = data.get("daily", {}).get("time", [])
         mins  = data.get("daily", {}).get("temperature_2m_min", [])
         return {d: t for d, t in zip(dates, mins) if t is not None}
@@ -32,18 +33,14 @@ def fetch_historical_mins(season_start, today_str):
 
 def update_frost_log(daily_data):
     try:
-        log = {}
         frost_log_file = Path(FROST_LOG_FILE)
-        if frost_log_file.exists():
-            try:
-                log = json.loads(frost_log_file.read_text()) or {}
-            except Exception:
-                log = {}
+        log = load_json(frost_log_file) or {}
 
-        today_str    = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        yesterday    = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
-        year         = datetime.now(timezone.utc).year
-        season_start = f"{year}-10-01" if today_str >= f"{year}-10-01" else f"{year-1}-10-01"
+        today        = datetime.now(timezone.utc).date()
+        today_str    = today.isoformat()
+        yesterday    = (today - timedelta(days=1)).isoformat()
+        season_year  = today.year if (today.month, today.day) >= (10, 1) else today.year - 1
+        season_start = date(season_year, 10, 1).isoformat()
 
         if log.get("season_start") != season_start:
             log = {
@@ -57,16 +54,26 @@ def update_frost_log(daily_data):
                 "logged_dates":     [],
             }
 
-        logged = set(log.get("logged_dates", []))
+        # Chronological list (persisted) + set for membership. New dates
+        # almost always sort last, so insort is an append in practice.
+        # The persisted order is trusted; only a legacy/hand-edited file
+        # that isn't strictly ascending gets sorted and de-duplicated once.
+        logged_dates = log.get("logged_dates") or []
+        if any(a >= b for a, b in zip(logged_dates, logged_dates[1:])):
+            logged_dates = sorted(set(logged_dates))
+        logged = set(logged_dates)
+
+        # ECMWF daily block, read once for both the log update and the
+        # upcoming-freeze scan below.
+        daily = (daily_data or {}).get("daily") or {}
+        dates = daily.get("time") or []
+        mins  = daily.get("temperature_2m_min") or []
 
         needs_backfill = len(logged) < 5
         if needs_backfill:
             logging.info("  ↻ Frost log: backfilling full season from Open-Meteo historical API...")
             date_mins = fetch_historical_mins(season_start, yesterday)
         else:
-            daily     = (daily_data or {}).get("daily", {}) or {}
-            dates     = daily.get("time", []) or []
-            mins      = daily.get("temperature_2m_min", []) or []
             date_mins = {d: t for d, t in zip(dates, mins)
                          if d < today_str and t is not None}
 
@@ -88,12 +95,10 @@ def update_frost_log(daily_data):
                 log["freeze_days"] += 1
                 log["last_freeze"]  = d
             logged.add(d)
+            bisect.insort(logged_dates, d)
 
-        log["logged_dates"] = sorted(list(logged))
+        log["logged_dates"] = logged_dates
 
-        daily   = (daily_data or {}).get("daily", {}) or {}
-        dates   = daily.get("time", []) or []
-        mins    = daily.get("temperature_2m_min", []) or []
         upcoming_freeze = []
         for d, t in zip(dates, mins):
             if d < today_str: continue
@@ -101,7 +106,9 @@ def update_frost_log(daily_data):
                 upcoming_freeze.append({"date": d, "min_f": round(t, 1)})
         log["upcoming_freeze_days"] = upcoming_freeze
 
-        frost_log_file.write_text(json.dumps(log, indent=2))
+        # Same layout as the indented GCS copy it is downloaded from, so an
+        # unchanged log is byte-identical and save_json skips the write
+        save_json(frost_log_file, log, indent=True)
         logging.info(f"  ✓ Frost log: {log['freeze_days']} freeze, {log['hard_freeze_days']} hard, "
               f"{log['severe_days']} severe | last: {log['last_freeze']} | "
               f"upcoming: {len(upcoming_freeze)}")
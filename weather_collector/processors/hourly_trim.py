@@ -5,6 +5,7 @@ The Open-Meteo hourly forecast returns timestamps starting at midnight UTC,
 which means at fetch time the first ~N entries are already in the past.
 This trim keeps the payload focused on what's still ahead.
 """
+from bisect import bisect_left
 from datetime import datetime
 
 import pytz
@@ -20,7 +21,12 @@ def trim_hourly_to_current_hour(weather_data):
     now_local = datetime.now(LOCAL_TZ)
     current_hour_iso = now_local.replace(minute=0, second=0, microsecond=0).strftime("%Y-%m-%dT%H:%M")
     hourly_times = weather_data.get("hourly", {}).get("times", [])
-    trim_idx = next((i for i, t in enumerate(hourly_times) if t >= current_hour_iso), 0)
+    # ISO "YYYY-MM-DDTHH:MM" strings sort chronologically, so the first hour
+    # at/after now is a binary search. All-past arrays are left untrimmed.
+    trim_idx = bisect_left(hourly_times, current_hour_iso)
+    if trim_idx >= len(hourly_times):
+        trim_idx = 0
     if trim_idx > 0 and "hourly" in weather_data:
-        for key in weather_data["hourly"]:
-            weather_data["hourly"][key] = weather_data["hourly"][key][trim_idx:]
+        # Update in place: other structures may already hold this dict
+        hourly = weather_data["hourly"]
+        hourly.update({key: arr[trim_idx:] for key, arr in hourly.items()})
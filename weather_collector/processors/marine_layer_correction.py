@@ -32,6 +32,7 @@ from datetime import datetime, timedelta
 import pytz
 
 from ..utils import redact_secrets
+from .state_stamp import synoptic_regime
 
 
 def _record_mlc_firing(regime, gated_count):
@@ -119,9 +120,7 @@ def stamp_marine_layer_correction(weather_data):
     times = hourly.get("times") or hourly.get("time") or []
     cc_arr = hourly.get("cloud_cover") or []
     wd_arr = hourly.get("wind_direction") or hourly.get("wind_direction_10m") or []
-    _regime_now = (
-        (weather_data.get("derived") or {}).get("state") or {}
-    ).get("regime_synoptic")
+    _regime_now = synoptic_regime(weather_data)
     if not times or not cc_arr:
         # Still log a zero-fire row so the rollup can distinguish "MLC
         # didn't run this tick" from "MLC ran with 0 fires."
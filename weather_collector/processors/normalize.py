@@ -3,7 +3,7 @@ Map raw Open-Meteo API responses to the canonical key naming used
 throughout the payload (no `_2m` / `_10m` / `_msl` suffixes; arrays
 default to [] when absent).
 """
-from ..utils import get_weather_description, get_weather_emoji
+from ..utils import get_weather_info
 
 
 _HOURLY_KEY_MAP = {
@@ -35,6 +35,26 @@ _HOURLY_KEY_MAP = {
     "precip_water_mm": "total_column_integrated_water_vapour",
 }
 
+# weather_description / weather_emoji are derived from weather_code; they
+# map to None here only to hold their position in the output dict.
+_CURRENT_KEY_MAP = {
+    "temperature": "temperature_2m",
+    "apparent_temperature": "apparent_temperature",
+    "humidity": "relative_humidity_2m",
+    "dew_point": "dew_point_2m",
+    "precipitation": "precipitation",
+    "weather_code": "weather_code",
+    "weather_description": None,
+    "weather_emoji": None,
+    "cloud_cover": "cloud_cover",
+    "pressure": "pressure_msl",
+    "wind_speed": "wind_speed_10m",
+    "wind_direction": "wind_direction_10m",
+    "wind_gusts": "wind_gusts_10m",
+    "uv_index": "uv_index",
+    "visibility": "visibility",
+}
+
 _DAILY_KEY_MAP = {
     "time": "time",
     "weather_code": "weather_code",
@@ -59,23 +79,9 @@ def normalize_current(current_data):
         return None
     cur = current_data.get("current", {})
     code = cur.get("weather_code", 0)
-    return {
-        "temperature": cur.get("temperature_2m"),
-        "apparent_temperature": cur.get("apparent_temperature"),
-        "humidity": cur.get("relative_humidity_2m"),
-        "dew_point": cur.get("dew_point_2m"),
-        "precipitation": cur.get("precipitation"),
-        "weather_code": cur.get("weather_code"),
-        "weather_description": get_weather_description(code),
-        "weather_emoji": get_weather_emoji(code),
-        "cloud_cover": cur.get("cloud_cover"),
-        "pressure": cur.get("pressure_msl"),
-        "wind_speed": cur.get("wind_speed_10m"),
-        "wind_direction": cur.get("wind_direction_10m"),
-        "wind_gusts": cur.get("wind_gusts_10m"),
-        "uv_index": cur.get("uv_index"),
-        "visibility": cur.get("visibility"),
-    }
+    out = {canonical: cur.get(raw_key) for canonical, raw_key in _CURRENT_KEY_MAP.items()}
+    out["weather_description"], out["weather_emoji"] = get_weather_info(code)
+    return out
 
 
 def normalize_hourly(hourly_data):
@@ -53,6 +53,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+from .state_stamp import synoptic_regime
+
 
 LEAD_BANDS = [
     ("0-5",   1,  5),
@@ -180,7 +182,7 @@ def run_specialist(spec: SpecialistSpec, weather_data: dict) -> None:
     table = load_table(spec.table_path, spec.operator_label)
     cells = table.get("cells", {})
 
-    state_curr = ((weather_data.get("derived") or {}).get("state") or {}).get("regime_synoptic") or "unknown"
+    state_curr = synoptic_regime(weather_data) or "unknown"
     persist_val, persist_src = spec.persistence_source(weather_data)
 
     n_leads = len(arr)
@@ -1,7 +1,12 @@
-import re
 """
 Precipitation type classification based on 850mb temperature
 """
+import math
+from bisect import bisect_right
+
+# Lower bounds (inclusive) of each band above "Heavy snow"
+_850MB_THRESHOLDS_F = (25, 32, 39)
+_850MB_LABELS = ("Heavy snow", "Snow", "Mixed", "Rain")
 
 
 def classify_850mb_precip_type(t_850mb_f):
@@ -22,15 +27,9 @@ def classify_850mb_precip_type(t_850mb_f):
     """
     if t_850mb_f is None:
         return None
-    
-    if t_850mb_f >= 39:
-        return "Rain"
-    elif t_850mb_f >= 32:
-        return "Mixed"
-    elif t_850mb_f >= 25:
-        return "Snow"
-    else:
-        return "Heavy snow"
+    if math.isnan(t_850mb_f):
+        return _850MB_LABELS[0]  # NaN compares false against every threshold
+    return _850MB_LABELS[bisect_right(_850MB_THRESHOLDS_F, t_850mb_f)]
 
 
 def add_850mb_precip_type(weather_data):
@@ -61,10 +60,8 @@ def add_850mb_precip_type(weather_data):
         if pop_now >= 20:
             weather_data["derived"]["col_precip_type"] = classify_850mb_precip_type(t_850_now)
     
-    # Column precip type for each hour
-    col_types = []
-    for t in temps_850:
-        col_types.append(classify_850mb_precip_type(t))
-    
+    # Column precip type for each hour (skipped outright with no hourly block)
     if "hourly" in weather_data:
-        weather_data["hourly"]["col_precip_type_850mb"] = col_types
+        weather_data["hourly"]["col_precip_type_850mb"] = [
+            classify_850mb_precip_type(t) for t in temps_850
+        ]
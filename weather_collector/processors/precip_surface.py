@@ -1,8 +1,12 @@
-import re
-import logging
 """
 Surface precipitation type classification using wet bulb temperature
 """
+import logging
+from bisect import bisect_right
+
+# Wet-bulb lower bounds (inclusive) of the "mixed" and "rain" bands
+_SURFACE_THRESHOLDS_F = (32.0, 35.0)
+_SURFACE_LABELS = ("snow", "mixed", "rain")
 
 
 def classify_surface_precip_type(wet_bulb_f):
@@ -25,13 +29,7 @@ def classify_surface_precip_type(wet_bulb_f):
     """
     if wet_bulb_f is None:
         return None
-    
-    if wet_bulb_f < 32.0:
-        return "snow"
-    elif wet_bulb_f < 35.0:
-        return "mixed"
-    else:
-        return "rain"
+    return _SURFACE_LABELS[bisect_right(_SURFACE_THRESHOLDS_F, wet_bulb_f)]
 
 
 def classify_hybrid_precip_type(wet_bulb_f, temp_850mb_f, freezing_level_ft=None):
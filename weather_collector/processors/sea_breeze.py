@@ -4,6 +4,8 @@ Sea breeze detection for coastal locations
 from datetime import datetime
 import pytz
 
+TZ = pytz.timezone("America/New_York")
+
 
 def detect_sea_breeze(weather_data):
     """
@@ -23,7 +25,7 @@ def detect_sea_breeze(weather_data):
     except (ValueError, TypeError):
         wind_dir = None
     
-    now = datetime.now(pytz.timezone("America/New_York"))
+    now = datetime.now(TZ)
     hour = now.hour
     
     result = {
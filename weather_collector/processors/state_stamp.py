@@ -102,3 +102,10 @@ def stamp_state(weather_data):
         f"octant={state['wind_octant']} ws={wind_speed}"
     )
     return state
+
+
+def synoptic_regime(weather_data):
+    """Read derived.state.regime_synoptic in one walk; None if not stamped."""
+    derived = weather_data.get("derived")
+    state = derived.get("state") if derived else None
+    return state.get("regime_synoptic") if state else None
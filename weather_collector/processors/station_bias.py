@@ -4,11 +4,11 @@ Tracks each station's chronic offset from the local consensus using
 a leave-one-out approach over a 48-hour rolling window.
 Covers temperature, humidity, and pressure.
 """
-import json
 import math
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
 from ..config import ELEVATION_FT
+from ..utils import dumps_json, loads_json
 import logging
 
 _EASTERN = ZoneInfo("America/New_York")
@@ -111,7 +111,7 @@ def load_history(gcs_client, bucket_name):
     try:
         blob = gcs_client.bucket(bucket_name).blob(GCS_PATH)
         if blob.exists():
-            return json.loads(blob.download_as_text())
+            return loads_json(blob.download_as_bytes())
         logging.info("  ℹ  No station_history.json yet (first run)")
     except Exception as e:
         logging.warning(f"  ⚠  Could not load station history: {e}")
@@ -121,7 +121,7 @@ def load_history(gcs_client, bucket_name):
 def save_history(history, gcs_client, bucket_name):
     try:
         blob = gcs_client.bucket(bucket_name).blob(GCS_PATH)
-        blob.upload_from_string(json.dumps(history), content_type="application/json")
+        blob.upload_from_string(dumps_json(history), content_type="application/json")
         logging.info(f"  ✓ Saved station history ({len(history)} stations)")
     except Exception as e:
         logging.warning(f"  ⚠  Could not save station history: {e}")
@@ -1,4 +1,3 @@
-import re
 """
 Calculate sunset azimuth and sample clouds directionally for accurate sunset quality prediction.
 """
@@ -1,4 +1,3 @@
-import re
 """
 Calculate 850mb geopotential height tendency (trough signal)
 """
@@ -28,7 +27,7 @@ def compute_trough_signal(hourly_data):
         return {}
     
     # Check all values are present
-    if not all(z is not None for z in z850_arr[:7]):
+    if None in z850_arr[:7]:
         return {}
     
     # Calculate 6-hour tendency
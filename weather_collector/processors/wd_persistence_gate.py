@@ -47,6 +47,7 @@ from pathlib import Path
 import pytz
 
 from .regime_classifier import classify_synoptic_regime
+from .state_stamp import synoptic_regime
 
 
 ENABLED = True  # Flipped 2026-07-27 v0.6.382 after 7-day gate cleared (Jaccard 1.0 across 5 daily reads).
@@ -212,7 +213,7 @@ def stamp_wd_persistence_gate(weather_data):
     table = _load_table()
     cells = table.get("cells", {})
 
-    state_curr = ((weather_data.get("derived") or {}).get("state") or {}).get("regime_synoptic") or "unknown"
+    state_curr = synoptic_regime(weather_data) or "unknown"
     persist_val, persist_src = _persistence_source(weather_data)
 
     n_leads = len(arr)
@@ -1,9 +1,11 @@
-import re
 """
 Wet bulb temperature calculation for precipitation type classification
 """
 import math
 
+_F_TO_C = 5 / 9
+_C_TO_F = 9 / 5
+
 
 def calculate_wet_bulb(t_f, rh_pct):
     """
@@ -22,18 +24,18 @@ def calculate_wet_bulb(t_f, rh_pct):
         return None
     
     # Convert to Celsius
-    t = (t_f - 32) * 5/9
+    t = (t_f - 32) * _F_TO_C
     rh = float(rh_pct)
     
-    # Stull's formula
-    tw = (t * math.atan(0.151977 * (rh + 8.313659) ** 0.5)
+    # Stull's formula (sqrt / rh*sqrt(rh) instead of the slower ** 0.5 / ** 1.5)
+    tw = (t * math.atan(0.151977 * math.sqrt(rh + 8.313659))
           + math.atan(t + rh)
           - math.atan(rh - 1.676331)
-          + 0.00391838 * rh ** 1.5 * math.atan(0.023101 * rh)
+          + 0.00391838 * rh * math.sqrt(rh) * math.atan(0.023101 * rh)
           - 4.686035)
     
     # Convert back to °F
-    return round(tw * 9/5 + 32, 1)
+    return round(tw * _C_TO_F + 32, 1)
 
 
 def add_wet_bulb_temps(weather_data):
@@ -49,11 +51,9 @@ def add_wet_bulb_temps(weather_data):
     temps = hourly.get("corrected_temperature") or hourly.get("temperature", [])
     humidity = hourly.get("corrected_humidity") or hourly.get("humidity", [])
 
-    wb_temps = []
-    for t, rh in zip(temps, humidity):
-        wb_temps.append(calculate_wet_bulb(t, rh))
-
-    weather_data["hourly"]["wet_bulb"] = wb_temps
+    weather_data["hourly"]["wet_bulb"] = [
+        calculate_wet_bulb(t, rh) for t, rh in zip(temps, humidity)
+    ]
 
     # Current wet bulb — use hyperlocal corrected values if available
     hyp = weather_data.get("hyperlocal", {})
@@ -13,6 +13,7 @@ from datetime import datetime, timezone
 
 import pytz
 from ..config import LAT as HOME_LAT, LON as HOME_LON
+from ..utils import hour_index
 
 
 def _circular_mean(directions):
@@ -456,10 +457,7 @@ def blend_observed_into_hourly(weather_data):
 
     now_local = datetime.now(_TZ_EASTERN)
     current_hour_iso = now_local.replace(minute=0, second=0, microsecond=0).strftime("%Y-%m-%dT%H:%M")
-    try:
-        current_idx = times.index(current_hour_iso)
-    except ValueError:
-        current_idx = 0
+    current_idx = hour_index(times, current_hour_iso) or 0
 
     end_idx = min(current_idx + BLEND_HOURS, len(gusts))
     for i in range(current_idx, end_idx):
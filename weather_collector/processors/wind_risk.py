@@ -1,13 +1,15 @@
-import re
 """
 Wind risk assessment using house-specific exposure model
 """
+import math
+from bisect import bisect_right
+
 from ..config import WIND_EXPOSURE_TABLE, WORRY_NOTICEABLE, WORRY_NOTABLE, WORRY_SIGNIFICANT, WORRY_SEVERE
+from ..utils import safe_float as safe_num
 
 
-def get_exposure_factor(deg):
-    """Return 0.0–1.0 site exposure for wind from deg degrees."""
-    d = int(deg) % 360
+def _scan_exposure_factor(d):
+    """Linear walk of WIND_EXPOSURE_TABLE for an integer bearing 0–359."""
     for min_d, max_d, factor in WIND_EXPOSURE_TABLE:
         if min_d <= max_d:
             if min_d <= d < max_d:
@@ -18,44 +20,45 @@ def get_exposure_factor(deg):
     return 0.5  # fallback
 
 
+# Bearings are quantized to whole degrees, so resolve every one up front.
+# Built from the scan itself so first-match-wins semantics carry over.
+_EXPOSURE_LUT = tuple(_scan_exposure_factor(d) for d in range(360))
+
+
+def get_exposure_factor(deg):
+    """Return 0.0–1.0 site exposure for wind from deg degrees."""
+    return _EXPOSURE_LUT[int(deg) % 360]
+
+
 def worry_score(speed, exp_factor):
     """Calculate worry score: speed * exposure_factor^1.5"""
     return round(speed * (exp_factor ** 1.5), 2)
 
 
+_WORRY_THRESHOLDS = (WORRY_NOTICEABLE, WORRY_NOTABLE, WORRY_SIGNIFICANT, WORRY_SEVERE)
+_WORRY_LABELS = ("Calm", "Light winds", "Breezy", "Windy", "Very windy")
+
+
 def worry_level(score):
-    """Classify worry score into severity level."""
-    if score >= WORRY_SEVERE:
-        return "Very windy"
-    if score >= WORRY_SIGNIFICANT:
-        return "Windy"
-    if score >= WORRY_NOTABLE:
-        return "Breezy"
-    if score >= WORRY_NOTICEABLE:
-        return "Light winds"
-    return "Calm"
-
-
-def safe_num(x):
-    """Convert to float, return None on failure."""
-    try:
-        return float(x)
-    except Exception:
-        return None
+    """Classify worry score into severity level (each threshold is inclusive)."""
+    if math.isnan(score):
+        return _WORRY_LABELS[0]  # NaN compares false against every threshold
+    return _WORRY_LABELS[bisect_right(_WORRY_THRESHOLDS, score)]
 
 
 def find_peak(values, dirs, times, n):
     """
     Find peak value in first n slots.
+    values/dirs must already be floats or None (see compute_wind_risk).
     Returns: (value, direction_deg, time_iso) or (None, None, None)
     """
     best_val, best_dir, best_time = -1.0, None, None
-    
-    for i in range(n):
-        v = safe_num(values[i]) if i < len(values) else None
-        d = safe_num(dirs[i]) if i < len(dirs) else None
-        t = times[i] if i < len(times) else None
-        
+    times = list(times[:n])
+    times += [None] * (n - len(times))
+
+    # zip stops at the shorter of values/dirs, which is where the old
+    # per-index bounds checks started returning None anyway
+    for v, d, t in zip(values[:n], dirs[:n], times):
         if v is None or d is None:
             continue
         
@@ -80,26 +83,29 @@ def compute_wind_risk(weather_data, peak_window_hours=12):
     Returns:
         dict: Wind risk assessment with gust and sustained sub-scores
     """
-    hourly_h = weather_data.get("hourly", {}) or {}
-    hourly_gusts = hourly_h.get("wind_gusts", []) or []
-    hourly_speeds = hourly_h.get("wind_speed", []) or []
-    hourly_dirs = hourly_h.get("wind_direction", []) or []
-    hourly_times = hourly_h.get("times", []) or []
+    hourly_h = weather_data.get("hourly") or {}
+    hourly_gusts = hourly_h.get("wind_gusts") or []
+    hourly_speeds = hourly_h.get("wind_speed") or []
+    hourly_dirs = hourly_h.get("wind_direction") or []
+    hourly_times = hourly_h.get("times") or []
 
     lookahead = min(peak_window_hours, len(hourly_gusts), len(hourly_dirs))
 
-    gust_val, gust_dir, gust_time = find_peak(hourly_gusts, hourly_dirs, hourly_times, lookahead)
-    sus_val, sus_dir, sus_time = find_peak(hourly_speeds, hourly_dirs, hourly_times, lookahead)
+    # Sanitize each column once; directions are shared by both searches
+    peak_dirs = [safe_num(d) for d in hourly_dirs[:lookahead]]
+    peak_gusts = [safe_num(v) for v in hourly_gusts[:lookahead]]
+    peak_speeds = [safe_num(v) for v in hourly_speeds[:lookahead]]
+    gust_val, gust_dir, gust_time = find_peak(peak_gusts, peak_dirs, hourly_times, lookahead)
+    sus_val, sus_dir, sus_time = find_peak(peak_speeds, peak_dirs, hourly_times, lookahead)
 
     # Fallback to current if hourly unavailable
-    if gust_val is None:
-        gust_val = safe_num(weather_data.get("current", {}).get("wind_gusts"))
-        gust_dir = safe_num(weather_data.get("current", {}).get("wind_direction"))
-        gust_time = None
-    if sus_val is None:
-        sus_val = safe_num(weather_data.get("current", {}).get("wind_speed"))
-        sus_dir = safe_num(weather_data.get("current", {}).get("wind_direction"))
-        sus_time = None
+    if gust_val is None or sus_val is None:
+        current = weather_data.get("current", {})
+        cur_dir = safe_num(current.get("wind_direction"))
+        if gust_val is None:
+            gust_val, gust_dir, gust_time = safe_num(current.get("wind_gusts")), cur_dir, None
+        if sus_val is None:
+            sus_val, sus_dir, sus_time = safe_num(current.get("wind_speed")), cur_dir, None
 
     wind_risk = {"window_hours": peak_window_hours}
 
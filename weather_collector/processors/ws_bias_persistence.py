@@ -42,6 +42,9 @@ import logging
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+from .state_stamp import synoptic_regime
+from ..utils import dumps_json, loads_json
+
 
 ENABLED = False   # 7-day flip gate. Stage 3 wired 2026-07-28; earliest flip 2026-08-04.
 
@@ -94,7 +97,7 @@ def load_state(gcs_client, bucket_name):
     try:
         blob = gcs_client.bucket(bucket_name).blob(GCS_STATE_PATH)
         if blob.exists():
-            return json.loads(blob.download_as_text())
+            return loads_json(blob.download_as_bytes())
         logging.info("  ℹ  No ws_bias_antecedent_state.json yet (first run)")
     except Exception as e:
         logging.warning(f"  ⚠  wsbp state load failed: {e}")
@@ -104,7 +107,7 @@ def load_state(gcs_client, bucket_name):
 def save_state(state, gcs_client, bucket_name):
     try:
         blob = gcs_client.bucket(bucket_name).blob(GCS_STATE_PATH)
-        blob.upload_from_string(json.dumps(state), content_type="application/json")
+        blob.upload_from_string(dumps_json(state), content_type="application/json")
     except Exception as e:
         logging.warning(f"  ⚠  wsbp state save failed: {e}")
 
@@ -154,7 +157,7 @@ def _current_bias(weather_data):
     obs = (weather_data.get("current") or {}).get(HOURLY_KEY)
     if fc_l1 is None or obs is None:
         return None, None
-    regime = ((weather_data.get("derived") or {}).get("state") or {}).get("regime_synoptic")
+    regime = synoptic_regime(weather_data)
     return (float(fc_l1) - float(obs)), regime
 
 
@@ -192,7 +195,7 @@ def stamp_ws_bias_persistence(weather_data, gcs_client=None, bucket_name=None):
         hourly[PRE_GATE_KEY] = list(ws_arr)
 
     cur_idx = _current_hour_index(hourly) or 0
-    regime_curr = ((weather_data.get("derived") or {}).get("state") or {}).get("regime_synoptic")
+    regime_curr = synoptic_regime(weather_data)
 
     ant = {}
     for r in focus_regimes:
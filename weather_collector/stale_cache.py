@@ -6,7 +6,7 @@ shows stale data rather than no data.
 import logging
 
 from .gcs_io import BUCKET, get_client, load_json
-from .utils import redact_secrets
+from .utils import loads_json, redact_secrets
 
 
 PREV_GCS_PATH = "weather_data.json"
@@ -27,8 +27,7 @@ def load_prev_weather_data():
         client = get_client()
         blob = client.bucket(BUCKET).blob(PREV_GCS_PATH)
         if blob.exists():
-            import json
-            prev = json.loads(blob.download_as_text())
+            prev = loads_json(blob.download_as_bytes())
             logging.warning(f"  ✓ Loaded previous weather_data.json from GCS for fallback cache")
             return prev
         else:
@@ -2,11 +2,18 @@
 Utility functions for weather data collection and processing
 """
 import math
+import os
 import re
 import json
+from bisect import bisect_left
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback for local runs without the wheel
+    orjson = None
+
 
 def redact_secrets(value):
     s = str(value)
@@ -24,45 +31,112 @@ def iso_utc_now() -> str:
 
 def safe_float(x):
     """Convert x to float, return None on failure."""
+    if x is None:
+        return None
+    if isinstance(x, float):
+        return float(x)
+    # Everything else, ints included, goes through the guard: float() of an
+    # oversized int raises OverflowError.
     try:
-        if x is None:
-            return None
         return float(x)
-    except Exception:
+    except (TypeError, ValueError, OverflowError):
         return None
 
 
+def loads_json(data):
+    """Parse JSON from bytes or str.
+
+    Uses orjson when installed (several times faster on the multi-MB GCS
+    logs). Falls back to stdlib json on a decode error so blobs written by
+    the old stdlib encoder that contain bare NaN/Infinity still load.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _finite_or_none(obj):
+    """Copy of obj with NaN/±Infinity floats replaced by None (stdlib path)."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite_or_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(v) for v in obj]
+    return obj
+
+
+def dumps_json(obj, indent=False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes; compact unless indent=True (2-space).
+
+    Non-string dict keys are stringified the same way stdlib json does them.
+    NaN and ±Infinity are written as null. That is orjson's behaviour, and
+    the stdlib fallback is made to match; the old stdlib encoder wrote bare
+    NaN, which is not JSON and fails the browser's JSON.parse.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    obj = _finite_or_none(obj)
+    if indent:
+        return json.dumps(obj, indent=2, allow_nan=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
 def load_json(path: Path):
     """Load JSON from file path, return None on any error."""
     try:
         if path.exists():
-            return json.loads(path.read_text())
+            return loads_json(path.read_bytes())
     except Exception:
         pass
     return None
 
 
-def save_json(path: Path, obj):
-    """Save object as JSON to file path with 2-space indent."""
-    path.write_text(json.dumps(obj, indent=2))
+def save_json(path: Path, obj, indent=False):
+    """Save object as JSON to file path. Compact unless indent=True (2-space).
+    Skips the write when the file already holds identical bytes; returns
+    True if the file was written. Writes go through a sibling temp file and
+    os.replace, so a crash mid-write never leaves a truncated file behind."""
+    data = dumps_json(obj, indent=indent)
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
 
 
 def compute_age_minutes(updated_at_iso: str, now_utc: datetime):
     """
     Compute age in minutes between ISO timestamp and now_utc.
-    Returns None if parsing fails.
+    Naive timestamps are taken as UTC. Returns None if parsing fails.
     """
     try:
-        s = updated_at_iso.replace("Z", "+00:00")
-        t = datetime.fromisoformat(s)
+        # py3.11+ fromisoformat accepts a trailing "Z"; subtracting two
+        # aware datetimes is offset-correct without an astimezone().
+        t = datetime.fromisoformat(updated_at_iso)
         if t.tzinfo is None:
             t = t.replace(tzinfo=timezone.utc)
-        delta = now_utc - t.astimezone(timezone.utc)
-        return round(delta.total_seconds() / 60.0, 1)
-    except Exception:
+        return round((now_utc - t).total_seconds() / 60.0, 1)
+    except (TypeError, ValueError):
         return None
 
 
+def hour_index(times, hour_iso):
+    """Index of hour_iso in a sorted list of "YYYY-MM-DDTHH:MM" strings, or
+    None if absent. Fixed-width ISO strings sort chronologically, so this is
+    a binary search rather than list.index()'s linear scan."""
+    i = bisect_left(times, hour_iso)
+    return i if i < len(times) and times[i] == hour_iso else None
+
+
 def magnus_dew_point_f(temp_f, rh_pct):
     """Magnus formula: dew point in °F from temperature °F and relative humidity %.
     Returns None if either input is missing or humidity is non-positive."""
@@ -95,6 +169,34 @@ def steadman_feels_like_f(temp_f, rh_pct=None, wind_mph=None, solar_wm2=None):
     return round(at_c * 9 / 5 + 32, 1)
 
 
+# WMO weather code → description / emoji. Module-level so each lookup is a
+# single dict probe instead of rebuilding the table per call.
+_WMO_DESC = {
+    0: "Clear", 1: "Mostly Clear", 2: "Partly Cloudy", 100: "Mostly Cloudy", 3: "Overcast",
+    45: "Fog", 48: "Freezing Fog",
+    51: "Light Drizzle", 53: "Drizzle", 55: "Heavy Drizzle",
+    61: "Light Rain", 63: "Rain", 65: "Heavy Rain",
+    71: "Light Snow", 73: "Snow", 75: "Heavy Snow",
+    77: "Snow Grains", 80: "Light Showers", 81: "Showers", 82: "Heavy Showers",
+    85: "Light Snow Showers", 86: "Snow Showers",
+    95: "Thunderstorm", 96: "Thunderstorm with Hail", 99: "Severe Thunderstorm"
+}
+
+_WMO_EMOJI = {
+    0: "☀️", 1: "🌤️", 2: "⛅", 100: "🌥️", 3: "☁️",
+    45: "🌫️", 48: "🌫️",
+    51: "🌦️", 53: "🌧️", 55: "🌧️",
+    61: "🌧️", 63: "🌧️", 65: "🌧️",
+    71: "🌨️", 73: "🌨️", 75: "🌨️",
+    77: "🌨️", 80: "🌦️", 81: "🌦️", 82: "🌧️",
+    85: "🌨️", 86: "🌨️",
+    95: "⛈️", 96: "⛈️", 99: "⛈️"
+}
+
+# Fused (description, emoji) table for callers that need both.
+_WMO_INFO = {code: (desc, _WMO_EMOJI[code]) for code, desc in _WMO_DESC.items()}
+
+
 def get_weather_description(code: int) -> str:
     """Convert WMO weather code to human-readable description.
 
@@ -104,29 +206,15 @@ def get_weather_description(code: int) -> str:
     cloud_cover thresholds matching NWS/civilian convention. Code 100 is
     out of WMO range; only our internal derive function emits it.
     """
-    codes = {
-        0: "Clear", 1: "Mostly Clear", 2: "Partly Cloudy", 100: "Mostly Cloudy", 3: "Overcast",
-        45: "Fog", 48: "Freezing Fog",
-        51: "Light Drizzle", 53: "Drizzle", 55: "Heavy Drizzle",
-        61: "Light Rain", 63: "Rain", 65: "Heavy Rain",
-        71: "Light Snow", 73: "Snow", 75: "Heavy Snow",
-        77: "Snow Grains", 80: "Light Showers", 81: "Showers", 82: "Heavy Showers",
-        85: "Light Snow Showers", 86: "Snow Showers",
-        95: "Thunderstorm", 96: "Thunderstorm with Hail", 99: "Severe Thunderstorm"
-    }
-    return codes.get(code, f"Code {code}")
+    return _WMO_DESC.get(code, f"Code {code}")
 
 
 def get_weather_emoji(code: int) -> str:
     """Convert WMO weather code to emoji."""
-    emojis = {
-        0: "☀️", 1: "🌤️", 2: "⛅", 100: "🌥️", 3: "☁️",
-        45: "🌫️", 48: "🌫️",
-        51: "🌦️", 53: "🌧️", 55: "🌧️",
-        61: "🌧️", 63: "🌧️", 65: "🌧️",
-        71: "🌨️", 73: "🌨️", 75: "🌨️",
-        77: "🌨️", 80: "🌦️", 81: "🌦️", 82: "🌧️",
-        85: "🌨️", 86: "🌨️",
-        95: "⛈️", 96: "⛈️", 99: "⛈️"
-    }
-    return emojis.get(code, "🌡️")
\ No newline at end of file
+    return _WMO_EMOJI.get(code, "🌡️")
+
+
+def get_weather_info(code: int) -> tuple:
+    """(description, emoji) for a WMO weather code in one lookup. Unknown
+    codes get the same fallbacks as the single-field helpers."""
+    return _WMO_INFO.get(code) or (f"Code {code}", "🌡️")